@@ -0,0 +1,27 @@
+"""Helpers shared across the pipeline's subpackages."""
+
+import os
+import sys
+from pathlib import Path
+
+# Keyword arguments for @dataclass: slots=True needs Python 3.10+, so older
+# interpreters fall back to __dict__ instances
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def atomic_write(path: Path, data: bytes) -> bool:
+    """
+    Write data to path through a temporary file and os.replace.
+
+    Parent directories are created as needed. Returns False instead of
+    raising on OSError: this is used for caches and checkpoints, which only
+    speed up later runs, so a failed write must not fail the current one.
+    """
+    tmp_file = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, path)
+        return True
+    except OSError:
+        return False
@@ -9,12 +9,21 @@ This module:
 - Validates configuration choices against research
 """
 
-import os
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from dataclasses import dataclass, replace
+from typing import Callable, Optional
 
+# Score penalty per concern severity
+_SEVERITY_PENALTY = {"critical": 25, "warning": 10, "suggestion": 3}
 
-@dataclass
+# Imported both as part of the src package and as a top-level package
+try:
+    from .._common import DATACLASS_SLOTS
+except ImportError:
+    from _common import DATACLASS_SLOTS
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Concern:
     """A concern or question about a user's choice."""
     severity: str  # critical, warning, suggestion
@@ -25,7 +34,7 @@ class Concern:
     context: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     """Result of validating user choices."""
     is_valid: bool
@@ -34,30 +43,333 @@ class ValidationResult:
     summary: str
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _AnswerFlags:
+    """Normalized view of the answers, computed once per analysis."""
+    is_cofounder: bool
+    is_assistant: bool
+    is_relaxed_security: bool
+    is_high_security: bool
+    is_max_security: bool
+    is_enterprise: bool
+    is_learning: bool
+    is_solo: bool
+    allows_full_deletion: bool
+    has_secrets: bool
+    has_secrets_location: bool
+    enable_memory: bool
+    enable_multi_model: bool
+    has_hooks: bool
+    has_agents: bool
+    has_commands: bool
+    has_review_command: bool
+    has_reflect_command: bool
+    has_code_reviewer: bool
+    has_security_auditor: bool
+    is_python: bool
+    is_javascript: bool
+    uses_js_package_manager: bool
+    uses_non_js_test_runner: bool
+
+    @classmethod
+    def from_answers(cls, answers: dict) -> "_AnswerFlags":
+        """Scan the answers once and derive every flag the checks need."""
+        autonomy = answers.get("autonomy_level", "")
+        security_level = answers.get("security_level", "")
+        purpose = answers.get("purpose", "")
+        language = answers.get("primary_language", "")
+        enable_agents = answers.get("enable_agents", [])
+        enable_commands = answers.get("enable_commands", [])
+
+        # Join once so each keyword test is a single substring search; the
+        # newline separator cannot appear in any keyword, so no false matches
+        agents_joined = "\n".join(enable_agents)
+        commands_joined_lower = "\n".join(enable_commands).lower()
+
+        return cls(
+            is_cofounder="Co-founder" in autonomy,
+            is_assistant="Assistant" in autonomy,
+            is_relaxed_security="Relaxed" in security_level,
+            is_high_security="High" in security_level,
+            is_max_security="Maximum" in security_level,
+            is_enterprise="Enterprise" in purpose,
+            is_learning="Learning" in purpose,
+            is_solo="Solo" in purpose,
+            allows_full_deletion="Yes" in answers.get("allow_file_deletion", ""),
+            has_secrets=bool(answers.get("has_secrets", False)),
+            has_secrets_location=bool(answers.get("secrets_location", "")),
+            enable_memory=bool(answers.get("enable_memory", False)),
+            enable_multi_model=bool(answers.get("enable_multi_model", False)),
+            has_hooks=bool(answers.get("enable_hooks", [])),
+            has_agents=bool(enable_agents),
+            has_commands=bool(enable_commands),
+            has_review_command="review" in commands_joined_lower,
+            has_reflect_command="reflect" in commands_joined_lower,
+            has_code_reviewer="Code Reviewer" in agents_joined,
+            has_security_auditor="Security" in agents_joined,
+            is_python="Python" in language,
+            is_javascript=language == "TypeScript/JavaScript",
+            uses_js_package_manager=answers.get("package_manager", "") in ("npm", "pnpm", "yarn"),
+            uses_non_js_test_runner=answers.get("test_runner", "") in ("pytest", "go test"),
+        )
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _Rule:
+    """A declarative check: emits its concern when the predicate holds."""
+    predicate: Callable[[_AnswerFlags], bool]
+    severity: str
+    category: str
+    message: str
+    question: str
+    recommendation: str
+    context: str = ""
+
+    def to_concern(self) -> Concern:
+        """Build the concern this rule reports."""
+        return Concern(
+            severity=self.severity,
+            category=self.category,
+            message=self.message,
+            question=self.question,
+            recommendation=self.recommendation,
+            context=self.context
+        )
+
+
+# Every advisor check, evaluated in order against the normalized answers
+_RULES = (
+    # Security-related choices
+    _Rule(
+        # High autonomy + relaxed security = risky
+        predicate=lambda f: f.is_cofounder and f.is_relaxed_security,
+        severity="warning",
+        category="security",
+        message="High autonomy with relaxed security may be risky",
+        question="Are you sure you want Claude to operate with minimal restrictions?",
+        recommendation="Consider 'Standard' security for co-founder mode to prevent accidental damage",
+        context="Co-founder mode gives Claude significant freedom. Pairing this with relaxed security removes most safeguards.",
+    ),
+    _Rule(
+        # Enterprise purpose but not high security
+        predicate=lambda f: f.is_enterprise and not (f.is_max_security or f.is_high_security),
+        severity="critical",
+        category="security",
+        message="Enterprise use case requires higher security level",
+        question="Is this configuration for production systems?",
+        recommendation="Switch to 'High' or 'Maximum' security for enterprise deployments",
+        context="Enterprise systems typically require stricter controls to meet compliance requirements.",
+    ),
+    _Rule(
+        # Allowing full deletion for enterprise
+        predicate=lambda f: f.is_enterprise and f.allows_full_deletion,
+        severity="warning",
+        category="security",
+        message="Unrestricted file deletion in enterprise context",
+        question="Should Claude be able to delete any file?",
+        recommendation="Use 'Limited - Only files it created' for enterprise deployments",
+        context="Unrestricted deletion can cause significant issues in production environments.",
+    ),
+    _Rule(
+        # No secrets configured but secrets location specified
+        predicate=lambda f: not f.has_secrets and f.has_secrets_location,
+        severity="suggestion",
+        category="security",
+        message="Secrets location specified but secrets not enabled",
+        question="Do you plan to use API keys or secrets?",
+        recommendation="Enable secrets management for multi-model features",
+        context="Many advanced features require API keys.",
+    ),
+
+    # Autonomy and workflow choices
+    _Rule(
+        # Co-founder mode without memory system
+        predicate=lambda f: f.is_cofounder and not f.enable_memory,
+        severity="warning",
+        category="workflow",
+        message="Co-founder mode works best with memory system",
+        question="Should Claude remember context across sessions?",
+        recommendation="Enable memory system for co-founder mode to maintain continuity",
+        context="Co-founders need to remember decisions, mistakes, and context to be effective.",
+    ),
+    _Rule(
+        # Learning purpose but assistant autonomy
+        predicate=lambda f: f.is_learning and f.is_assistant,
+        severity="suggestion",
+        category="workflow",
+        message="Learning mode may benefit from more autonomy",
+        question="Do you want Claude to guide your learning proactively?",
+        recommendation="Consider 'Senior dev' autonomy for more educational interactions",
+        context="Higher autonomy allows Claude to point out learning opportunities.",
+    ),
+    _Rule(
+        # Solo dev with low autonomy
+        predicate=lambda f: f.is_solo and f.is_assistant,
+        severity="suggestion",
+        category="workflow",
+        message="Solo developers often benefit from higher autonomy",
+        question="Do you want to spend less time directing Claude?",
+        recommendation="Consider 'Co-founder' or 'Senior dev' for solo projects",
+        context="Without a team to review, autonomous Claude can iterate faster.",
+    ),
+
+    # Enabled features should make sense together
+    _Rule(
+        # Multi-model without review command
+        predicate=lambda f: f.enable_multi_model and not f.has_review_command,
+        severity="suggestion",
+        category="features",
+        message="Multi-model enabled but no review command",
+        question="How will you trigger multi-model reviews?",
+        recommendation="Add '/review' command to easily invoke multi-model reviews",
+        context="Multi-model review is most useful when easily accessible via command.",
+    ),
+    _Rule(
+        # Code reviewer agent without review workflow
+        predicate=lambda f: f.has_code_reviewer and not f.enable_multi_model,
+        severity="suggestion",
+        category="features",
+        message="Code reviewer agent without multi-model review",
+        question="Would you like multiple perspectives on code reviews?",
+        recommendation="Enable multi-model review for more comprehensive code analysis",
+        context="Multiple models catch different types of issues.",
+    ),
+    _Rule(
+        # Metrics tracking without hooks
+        predicate=lambda f: f.has_agents and not f.has_hooks,
+        severity="suggestion",
+        category="features",
+        message="Agents enabled but no hooks configured",
+        question="Would automated triggers improve your workflow?",
+        recommendation="Consider enabling hooks for automatic quality checks",
+        context="Hooks can trigger agents automatically at the right moments.",
+    ),
+
+    # Tech stack choices should align with other settings
+    _Rule(
+        # Python with npm
+        predicate=lambda f: f.is_python and f.uses_js_package_manager,
+        severity="warning",
+        category="tech_stack",
+        message="Python language with JavaScript package manager",
+        question="Is your project actually a polyglot project?",
+        recommendation="Use pip/poetry for Python projects, or select 'Multiple languages'",
+        context="Mismatched tools can cause confusion in generated commands.",
+    ),
+    _Rule(
+        # JavaScript without jest/vitest
+        predicate=lambda f: f.is_javascript and f.uses_non_js_test_runner,
+        severity="warning",
+        category="tech_stack",
+        message="JavaScript project with non-JavaScript test runner",
+        question="What test framework do you actually use?",
+        recommendation="Consider jest or vitest for JavaScript/TypeScript projects",
+        context="Test runner should match your actual project setup.",
+    ),
+
+    # Missing essential configurations
+    _Rule(
+        # No reflect command but memory enabled
+        predicate=lambda f: f.enable_memory and not f.has_reflect_command,
+        severity="suggestion",
+        category="essentials",
+        message="Memory system without reflection capability",
+        question="How will Claude learn from mistakes?",
+        recommendation="Add '/reflect' command to enable learning from errors",
+        context="Reflection is key to improving the memory system's value.",
+    ),
+    _Rule(
+        # High security but no security auditor
+        predicate=lambda f: (f.is_high_security or f.is_max_security) and not f.has_security_auditor,
+        severity="suggestion",
+        category="essentials",
+        message="High security level without security auditor agent",
+        question="Would automated security scanning help?",
+        recommendation="Enable Security Auditor agent for proactive vulnerability detection",
+        context="Security auditor can catch issues before they reach production.",
+    ),
+    _Rule(
+        # No commands at all
+        predicate=lambda f: not f.has_commands,
+        severity="suggestion",
+        category="essentials",
+        message="No slash commands configured",
+        question="Would quick commands improve your workflow?",
+        recommendation="Consider adding at least /review and /reflect commands",
+        context="Commands provide quick access to common operations.",
+    ),
+)
+
+
+def _freeze(value):
+    """Convert an answers value into a hashable equivalent for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class CriticalAdvisor:
     """Critically analyzes user choices and configurations."""
 
     def __init__(self, research_results: Optional[dict] = None):
         self.research_results = research_results or {}
         self.concerns: list[Concern] = []
+        self._buckets: dict[str, list[Concern]] = self._bucket_concerns([])
+        self._cache: dict[tuple, ValidationResult] = {}
+        self._score = 100
+
+    @staticmethod
+    def _bucket_concerns(concerns: list[Concern]) -> dict[str, list[Concern]]:
+        """Partition concerns by severity in a single pass."""
+        buckets: dict[str, list[Concern]] = {"critical": [], "warning": [], "suggestion": []}
+        for concern in concerns:
+            bucket = buckets.get(concern.severity)
+            if bucket is not None:
+                bucket.append(concern)
+        return buckets
+
+    def reset(self) -> None:
+        """Clear cached analysis results and current concerns."""
+        self._cache.clear()
+        self.concerns = []
+        self._buckets = self._bucket_concerns([])
+        self._score = 100
 
     def analyze_choices(self, answers: dict) -> ValidationResult:
-        """Analyze user choices and identify potential issues."""
+        """
+        Analyze user choices and identify potential issues.
+
+        Results are cached on this instance, keyed on the answers. Callers get
+        their own copy of the result (and of ``self.concerns``), so changing
+        either never affects the cached entry.
+        """
+        key = _freeze(answers)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.concerns = list(cached.concerns)
+            self._buckets = self._bucket_concerns(self.concerns)
+            self._score = cached.score
+            return replace(cached, concerns=self.concerns)
+
         self.concerns = []
+        self._score = 100
+
+        flags = _AnswerFlags.from_answers(answers)
 
         # Check for common anti-patterns
-        self._check_security_choices(answers)
-        self._check_autonomy_choices(answers)
-        self._check_feature_coherence(answers)
-        self._check_tech_stack_alignment(answers)
-        self._check_missing_essentials(answers)
+        for rule in _RULES:
+            if rule.predicate(flags):
+                self._add_concern(rule.to_concern())
 
         # Calculate overall score
         score = self._calculate_score()
 
         # Build summary
-        critical_count = len([c for c in self.concerns if c.severity == "critical"])
-        warning_count = len([c for c in self.concerns if c.severity == "warning"])
+        self._buckets = self._bucket_concerns(self.concerns)
+        critical_count = len(self._buckets["critical"])
+        warning_count = len(self._buckets["warning"])
 
         if critical_count > 0:
             summary = f"Found {critical_count} critical issue(s) that should be addressed"
@@ -68,238 +380,23 @@ class CriticalAdvisor:
         else:
             summary = "Configuration looks solid!"
 
-        return ValidationResult(
+        result = ValidationResult(
             is_valid=critical_count == 0,
             concerns=self.concerns,
             score=score,
             summary=summary
         )
+        self._cache[key] = replace(result, concerns=list(self.concerns))
+        return result
 
-    def _check_security_choices(self, answers: dict) -> None:
-        """Check security-related choices."""
-        security_level = answers.get("security_level", "")
-        allow_deletion = answers.get("allow_file_deletion", "")
-        autonomy = answers.get("autonomy_level", "")
-        purpose = answers.get("purpose", "")
-
-        # High autonomy + relaxed security = risky
-        if "Co-founder" in autonomy and "Relaxed" in security_level:
-            self.concerns.append(Concern(
-                severity="warning",
-                category="security",
-                message="High autonomy with relaxed security may be risky",
-                question="Are you sure you want Claude to operate with minimal restrictions?",
-                recommendation="Consider 'Standard' security for co-founder mode to prevent accidental damage",
-                context="Co-founder mode gives Claude significant freedom. Pairing this with relaxed security removes most safeguards."
-            ))
-
-        # Enterprise purpose but not high security
-        if "Enterprise" in purpose and "Maximum" not in security_level and "High" not in security_level:
-            self.concerns.append(Concern(
-                severity="critical",
-                category="security",
-                message="Enterprise use case requires higher security level",
-                question="Is this configuration for production systems?",
-                recommendation="Switch to 'High' or 'Maximum' security for enterprise deployments",
-                context="Enterprise systems typically require stricter controls to meet compliance requirements."
-            ))
-
-        # Allowing full deletion for enterprise
-        if "Enterprise" in purpose and "Yes" in allow_deletion:
-            self.concerns.append(Concern(
-                severity="warning",
-                category="security",
-                message="Unrestricted file deletion in enterprise context",
-                question="Should Claude be able to delete any file?",
-                recommendation="Use 'Limited - Only files it created' for enterprise deployments",
-                context="Unrestricted deletion can cause significant issues in production environments."
-            ))
-
-        # No secrets configured but secrets location specified
-        has_secrets = answers.get("has_secrets", False)
-        secrets_location = answers.get("secrets_location", "")
-        if not has_secrets and secrets_location:
-            self.concerns.append(Concern(
-                severity="suggestion",
-                category="security",
-                message="Secrets location specified but secrets not enabled",
-                question="Do you plan to use API keys or secrets?",
-                recommendation="Enable secrets management for multi-model features",
-                context="Many advanced features require API keys."
-            ))
-
-    def _check_autonomy_choices(self, answers: dict) -> None:
-        """Check autonomy and workflow choices."""
-        autonomy = answers.get("autonomy_level", "")
-        purpose = answers.get("purpose", "")
-        enable_memory = answers.get("enable_memory", False)
-
-        # Co-founder mode without memory system
-        if "Co-founder" in autonomy and not enable_memory:
-            self.concerns.append(Concern(
-                severity="warning",
-                category="workflow",
-                message="Co-founder mode works best with memory system",
-                question="Should Claude remember context across sessions?",
-                recommendation="Enable memory system for co-founder mode to maintain continuity",
-                context="Co-founders need to remember decisions, mistakes, and context to be effective."
-            ))
-
-        # Learning purpose but assistant autonomy
-        if "Learning" in purpose and "Assistant" in autonomy:
-            self.concerns.append(Concern(
-                severity="suggestion",
-                category="workflow",
-                message="Learning mode may benefit from more autonomy",
-                question="Do you want Claude to guide your learning proactively?",
-                recommendation="Consider 'Senior dev' autonomy for more educational interactions",
-                context="Higher autonomy allows Claude to point out learning opportunities."
-            ))
-
-        # Solo dev with low autonomy
-        if "Solo" in purpose and "Assistant" in autonomy:
-            self.concerns.append(Concern(
-                severity="suggestion",
-                category="workflow",
-                message="Solo developers often benefit from higher autonomy",
-                question="Do you want to spend less time directing Claude?",
-                recommendation="Consider 'Co-founder' or 'Senior dev' for solo projects",
-                context="Without a team to review, autonomous Claude can iterate faster."
-            ))
-
-    def _check_feature_coherence(self, answers: dict) -> None:
-        """Check that enabled features make sense together."""
-        enable_multi_model = answers.get("enable_multi_model", False)
-        enable_hooks = answers.get("enable_hooks", [])
-        enable_agents = answers.get("enable_agents", [])
-        enable_commands = answers.get("enable_commands", [])
-
-        # Multi-model without review command
-        if enable_multi_model:
-            review_commands = [c for c in enable_commands if "review" in c.lower()]
-            if not review_commands:
-                self.concerns.append(Concern(
-                    severity="suggestion",
-                    category="features",
-                    message="Multi-model enabled but no review command",
-                    question="How will you trigger multi-model reviews?",
-                    recommendation="Add '/review' command to easily invoke multi-model reviews",
-                    context="Multi-model review is most useful when easily accessible via command."
-                ))
-
-        # Code reviewer agent without review workflow
-        code_reviewer = any("Code Reviewer" in a for a in enable_agents)
-        if code_reviewer and not enable_multi_model:
-            self.concerns.append(Concern(
-                severity="suggestion",
-                category="features",
-                message="Code reviewer agent without multi-model review",
-                question="Would you like multiple perspectives on code reviews?",
-                recommendation="Enable multi-model review for more comprehensive code analysis",
-                context="Multiple models catch different types of issues."
-            ))
-
-        # Metrics tracking without hooks
-        if enable_agents and not enable_hooks:
-            self.concerns.append(Concern(
-                severity="suggestion",
-                category="features",
-                message="Agents enabled but no hooks configured",
-                question="Would automated triggers improve your workflow?",
-                recommendation="Consider enabling hooks for automatic quality checks",
-                context="Hooks can trigger agents automatically at the right moments."
-            ))
-
-    def _check_tech_stack_alignment(self, answers: dict) -> None:
-        """Check that tech stack choices align with other settings."""
-        language = answers.get("primary_language", "")
-        frameworks = answers.get("frameworks", [])
-        package_manager = answers.get("package_manager", "")
-        test_runner = answers.get("test_runner", "")
-
-        # Python with npm
-        if "Python" in language and package_manager in ["npm", "pnpm", "yarn"]:
-            self.concerns.append(Concern(
-                severity="warning",
-                category="tech_stack",
-                message="Python language with JavaScript package manager",
-                question="Is your project actually a polyglot project?",
-                recommendation="Use pip/poetry for Python projects, or select 'Multiple languages'",
-                context="Mismatched tools can cause confusion in generated commands."
-            ))
-
-        # JavaScript without jest/vitest
-        if language in ["TypeScript/JavaScript"] and test_runner in ["pytest", "go test"]:
-            self.concerns.append(Concern(
-                severity="warning",
-                category="tech_stack",
-                message="JavaScript project with non-JavaScript test runner",
-                question="What test framework do you actually use?",
-                recommendation="Consider jest or vitest for JavaScript/TypeScript projects",
-                context="Test runner should match your actual project setup."
-            ))
-
-        # React without Next.js awareness
-        if any("React" in f for f in frameworks) and not any("Next" in f for f in frameworks):
-            # Just a suggestion, not a concern
-            pass
-
-    def _check_missing_essentials(self, answers: dict) -> None:
-        """Check for missing essential configurations."""
-        enable_commands = answers.get("enable_commands", [])
-        enable_agents = answers.get("enable_agents", [])
-        enable_memory = answers.get("enable_memory", False)
-        security_level = answers.get("security_level", "")
-
-        # No reflect command but memory enabled
-        has_reflect = any("reflect" in c.lower() for c in enable_commands)
-        if enable_memory and not has_reflect:
-            self.concerns.append(Concern(
-                severity="suggestion",
-                category="essentials",
-                message="Memory system without reflection capability",
-                question="How will Claude learn from mistakes?",
-                recommendation="Add '/reflect' command to enable learning from errors",
-                context="Reflection is key to improving the memory system's value."
-            ))
-
-        # High security but no security auditor
-        has_security_auditor = any("Security" in a for a in enable_agents)
-        if "High" in security_level or "Maximum" in security_level:
-            if not has_security_auditor:
-                self.concerns.append(Concern(
-                    severity="suggestion",
-                    category="essentials",
-                    message="High security level without security auditor agent",
-                    question="Would automated security scanning help?",
-                    recommendation="Enable Security Auditor agent for proactive vulnerability detection",
-                    context="Security auditor can catch issues before they reach production."
-                ))
-
-        # No commands at all
-        if not enable_commands:
-            self.concerns.append(Concern(
-                severity="suggestion",
-                category="essentials",
-                message="No slash commands configured",
-                question="Would quick commands improve your workflow?",
-                recommendation="Consider adding at least /review and /reflect commands",
-                context="Commands provide quick access to common operations."
-            ))
+    def _add_concern(self, concern: Concern) -> None:
+        """Record a concern and apply its penalty to the running score."""
+        self._score -= _SEVERITY_PENALTY.get(concern.severity, 0)
+        self.concerns.append(concern)
 
     def _calculate_score(self) -> int:
         """Calculate an overall confidence score (0-100)."""
-        base_score = 100
-
-        for concern in self.concerns:
-            if concern.severity == "critical":
-                base_score -= 25
-            elif concern.severity == "warning":
-                base_score -= 10
-            elif concern.severity == "suggestion":
-                base_score -= 3
-
-        return max(0, min(100, base_score))
+        return max(0, min(100, self._score))
 
     def present_concerns(self) -> bool:
         """Present concerns to user and allow them to address them.
@@ -310,38 +407,45 @@ class CriticalAdvisor:
             print("\n✅ Your configuration looks great! No concerns identified.")
             return True
 
-        critical = [c for c in self.concerns if c.severity == "critical"]
-        warnings = [c for c in self.concerns if c.severity == "warning"]
-        suggestions = [c for c in self.concerns if c.severity == "suggestion"]
+        critical = self._buckets["critical"]
+        warnings = self._buckets["warning"]
+        suggestions = self._buckets["suggestion"]
 
-        print("\n" + "=" * 60)
-        print("🤔 CONFIGURATION REVIEW")
-        print("=" * 60)
+        # Buffer the report and emit it with a single write
+        lines = [
+            "\n" + "=" * 60,
+            "🤔 CONFIGURATION REVIEW",
+            "=" * 60,
+        ]
 
         if critical:
-            print("\n❌ CRITICAL ISSUES (should fix)")
+            lines.append("\n❌ CRITICAL ISSUES (should fix)")
             for c in critical:
-                print(f"\n   {c.message}")
-                print(f"   → {c.question}")
-                print(f"   💡 {c.recommendation}")
+                lines.append(f"\n   {c.message}")
+                lines.append(f"   → {c.question}")
+                lines.append(f"   💡 {c.recommendation}")
 
         if warnings:
-            print("\n⚠️  WARNINGS (consider addressing)")
+            lines.append("\n⚠️  WARNINGS (consider addressing)")
             for c in warnings:
-                print(f"\n   {c.message}")
-                print(f"   → {c.question}")
-                print(f"   💡 {c.recommendation}")
+                lines.append(f"\n   {c.message}")
+                lines.append(f"   → {c.question}")
+                lines.append(f"   💡 {c.recommendation}")
 
         if suggestions:
-            print("\n💡 SUGGESTIONS (optional improvements)")
+            lines.append("\n💡 SUGGESTIONS (optional improvements)")
             for c in suggestions[:3]:  # Limit to top 3
-                print(f"\n   {c.message}")
-                print(f"   💡 {c.recommendation}")
+                lines.append(f"\n   {c.message}")
+                lines.append(f"   💡 {c.recommendation}")
+
+        lines.append("\n" + "-" * 60)
+
+        if critical:
+            lines.append("\n⚠️  Critical issues found. Strongly recommend addressing them.")
 
-        print("\n" + "-" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         if critical:
-            print("\n⚠️  Critical issues found. Strongly recommend addressing them.")
             choice = input("Continue anyway? [y/N]: ").strip().lower()
             return choice == 'y'
         else:
@@ -10,14 +10,122 @@ Extracts patterns from:
 - Hook patterns
 """
 
-import json
+import functools
+import os
+import pickle
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TypedDict
+
+# Imported both as part of the src package and as a top-level package
+try:
+    from .._common import DATACLASS_SLOTS, atomic_write
+except ImportError:
+    from _common import DATACLASS_SLOTS, atomic_write
+
+# Optional fast JSON parser; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patterns are compiled once and shared across every file analyzed
+_RE_IDENTITY = re.compile(r'[Aa]ddress me as ["\']?(\w+)["\']?')
+_RE_FRONTMATTER = re.compile(r'^---\s*\n(.*?)\n---', re.DOTALL)
+_RE_FIELD = re.compile(r'^(\w[\w-]*):[ \t]*(.*)$', re.MULTILINE)
+
+# CLAUDE.md section heading -> (pattern type, pattern name)
+_CLAUDE_MD_SECTIONS = {
+    "Tech Stack": ("tech_stack", "tech_stack"),
+    "Commands": ("commands", "build_commands"),
+    "Before Any Task": ("checklist", "before_task"),
+    "After Any Task": ("checklist", "after_task"),
+}
+
+# Hook command keyword -> inferred purpose, checked in order
+_HOOK_KEYWORDS = (
+    ("safety", "Safety check"),
+    ("metric", "Metrics collection"),
+    ("track", "File tracking"),
+    ("lint", "Linting"),
+    ("notify", "Notification"),
+    ("summary", "Session summary"),
+    ("reflex", "Self-reflection"),
+    ("reflect", "Self-reflection"),
+)
+
+
+def _extract_section(content: str, heading: str) -> Optional[str]:
+    """Return the body of the first `## <heading>` section, or None if absent.
+
+    Uses plain string searches rather than a regex: the heading must start a
+    line, and the body runs until the next line starting with `##`.
+    """
+    marker = "## " + heading
+    pos = content.find(marker)
+    while pos >= 0:
+        line_end = content.find("\n", pos)
+        if line_end < 0:
+            return None
+        at_line_start = pos == 0 or content[pos - 1] == "\n"
+        if at_line_start and not content[pos + len(marker):line_end].strip():
+            end = content.find("\n##", line_end)
+            return content[line_end + 1:end if end >= 0 else len(content)]
+        pos = content.find(marker, line_end)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _infer_hook_purpose_cached(command: str) -> str:
+    """Infer the purpose of a hook from its command (memoized per command)."""
+    command_lower = command.lower()
+    for keyword, purpose in _HOOK_KEYWORDS:
+        if keyword in command_lower:
+            return purpose
+    return "Custom"
+
+
+class PatternSummary(TypedDict):
+    """A config pattern as returned by ConfigAnalyzer.analyze()."""
+    type: str
+    name: str
+    source: str
 
 
-@dataclass
+class AgentSummary(TypedDict):
+    """An agent as returned by ConfigAnalyzer.analyze()."""
+    name: str
+    description: str
+    tools: list[str]
+
+
+class CommandSummary(TypedDict):
+    """A command as returned by ConfigAnalyzer.analyze()."""
+    name: str
+    description: str
+
+
+class HookSummary(TypedDict):
+    """A hook as returned by ConfigAnalyzer.analyze()."""
+    event: str
+    matcher: str
+    purpose: str
+
+
+class AnalysisSummary(TypedDict, total=False):
+    """Result of ConfigAnalyzer.analyze(); empty when the configs path is missing."""
+    configs: list[str]
+    patterns: list[PatternSummary]
+    agents: list[AgentSummary]
+    commands: list[CommandSummary]
+    hooks: list[HookSummary]
+    settings_patterns: list[dict]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ConfigPattern:
     """A pattern extracted from a configuration."""
     type: str  # claude_md, settings, agent, command, hook
@@ -27,7 +135,7 @@ class ConfigPattern:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExtractedAgent:
     """An agent definition extracted from configs."""
     name: str
@@ -37,7 +145,7 @@ class ExtractedAgent:
     instructions: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExtractedCommand:
     """A command definition extracted from configs."""
     name: str
@@ -46,7 +154,7 @@ class ExtractedCommand:
     instructions: str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExtractedHook:
     """A hook pattern extracted from configs."""
     event: str  # PostToolUse, PreToolUse, Stop, etc.
@@ -55,16 +163,38 @@ class ExtractedHook:
     purpose: str = ""
 
 
+@dataclass
+class _DirResult:
+    """Everything extracted from a single configuration directory."""
+    patterns: list[ConfigPattern] = field(default_factory=list)
+    agents: list[ExtractedAgent] = field(default_factory=list)
+    commands: list[ExtractedCommand] = field(default_factory=list)
+    hooks: list[ExtractedHook] = field(default_factory=list)
+    settings_patterns: list[dict] = field(default_factory=list)
+
+
 class ConfigAnalyzer:
     """Analyzes existing configurations to extract patterns."""
 
-    def __init__(self, configs_path: str):
+    # Where configs are looked for when no path is given (resolved once at import)
+    DEFAULT_CONFIGS_PATH = Path.home() / "claude-configs"
+
+    # Per-directory results are cached here, keyed by directory and file mtimes.
+    # Kept under the user's cache dir (never inside configs_path) because
+    # unpickling a file from a shared or cloned configs tree is unsafe.
+    CACHE_FILE = Path.home() / ".cache" / "config-setup-pipeline" / "config_analyzer.pkl"
+    CACHE_VERSION = 2
+
+    def __init__(self, configs_path: str, cache_file: Optional[Path] = None, use_cache: bool = True):
         self.configs_path = Path(configs_path).resolve()
+        self.cache_file = cache_file or self.CACHE_FILE
+        self.use_cache = use_cache
         self.patterns: list[ConfigPattern] = []
         self.agents: list[ExtractedAgent] = []
         self.commands: list[ExtractedCommand] = []
         self.hooks: list[ExtractedHook] = []
         self.settings_patterns: list[dict] = []
+        self._dir_cache: dict[str, tuple[tuple, _DirResult]] = {}
 
     def _validate_path(self, path: Path) -> bool:
         """Validate that path is within the configs directory (prevent path traversal)."""
@@ -74,16 +204,30 @@ class ConfigAnalyzer:
         except (OSError, ValueError):
             return False
 
-    def _safe_read(self, path: Path) -> Optional[str]:
-        """Safely read a file after validating its path."""
+    def _safe_read_bytes(self, path: Path) -> Optional[bytes]:
+        """Safely read a file's raw bytes after validating its path."""
         if not self._validate_path(path):
             return None
         try:
-            return path.read_text()
-        except (OSError, IOError):
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _safe_read(self, path: Path) -> Optional[str]:
+        """Safely read a UTF-8 file after validating its path.
+
+        Decodes the raw bytes directly, skipping the locale lookup and newline
+        translation done by read_text(); parsing tolerates CRLF line endings.
+        """
+        content = self._safe_read_bytes(path)
+        if content is None:
+            return None
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError:
             return None
 
-    def analyze(self) -> dict:
+    def analyze(self) -> AnalysisSummary:
         """Analyze all configurations and extract patterns."""
         if not self.configs_path.exists():
             return {}
@@ -91,8 +235,28 @@ class ConfigAnalyzer:
         # Find all config directories
         config_dirs = self._find_config_dirs()
 
-        for config_dir in config_dirs:
-            self._analyze_config_dir(config_dir)
+        if self.use_cache:
+            self._load_cache()
+
+        # Directories are independent and I/O-bound, so analyze them concurrently
+        # and merge the per-directory results in discovery order
+        if config_dirs:
+            with ThreadPoolExecutor(max_workers=min(32, len(config_dirs))) as executor:
+                results = list(executor.map(self._analyze_config_dir_cached, config_dirs))
+
+            cache_changed = False
+            for config_dir, (fingerprint, result, hit) in zip(config_dirs, results):
+                if not hit:
+                    self._dir_cache[str(config_dir)] = (fingerprint, result)
+                    cache_changed = True
+                self.patterns.extend(result.patterns)
+                self.agents.extend(result.agents)
+                self.commands.extend(result.commands)
+                self.hooks.extend(result.hooks)
+                self.settings_patterns.extend(result.settings_patterns)
+
+            if self.use_cache and cache_changed:
+                self._save_cache()
 
         return {
             "configs": [p.name for p in config_dirs],
@@ -117,115 +281,151 @@ class ConfigAnalyzer:
 
     def _find_config_dirs(self) -> list[Path]:
         """Find directories containing Claude configurations."""
-        config_dirs = []
-
-        # Look for CLAUDE.md files
-        for claude_md in self.configs_path.rglob("CLAUDE.md"):
-            config_dirs.append(claude_md.parent)
+        config_dirs: set[Path] = set()
 
-        # Look for .claude directories
-        for claude_dir in self.configs_path.rglob(".claude"):
-            if claude_dir.is_dir():
-                parent = claude_dir.parent
-                if parent not in config_dirs:
-                    config_dirs.append(parent)
+        # Single walk: a directory counts if it holds CLAUDE.md or a .claude/ dir
+        for dirpath, dirnames, filenames in os.walk(self.configs_path):
+            if "CLAUDE.md" in filenames or ".claude" in dirnames:
+                config_dirs.add(Path(dirpath))
 
-        return list(set(config_dirs))
+        return list(config_dirs)
 
-    def _analyze_config_dir(self, config_dir: Path) -> None:
+    def _load_cache(self) -> None:
+        """Load cached per-directory results; a missing or corrupt cache is rebuilt."""
+        try:
+            with open(self.cache_file, "rb") as f:
+                version, entries = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception:
+            # Corrupt or incompatible cache - start fresh, it is rewritten after analysis
+            return
+        if version == self.CACHE_VERSION and isinstance(entries, dict):
+            self._dir_cache = entries
+
+    def _save_cache(self) -> None:
+        """Atomically persist per-directory results for the next run."""
+        data = pickle.dumps((self.CACHE_VERSION, self._dir_cache), protocol=pickle.HIGHEST_PROTOCOL)
+        atomic_write(self.cache_file, data)
+
+    def _fingerprint(self, config_dir: Path) -> tuple:
+        """Fingerprint the files a directory's analysis depends on (path, mtime, size)."""
+        claude_dir = config_dir / ".claude"
+        paths = [config_dir / "CLAUDE.md", claude_dir / "settings.json"]
+        paths += self._list_markdown(claude_dir / "agents")
+        paths += self._list_markdown(claude_dir / "commands")
+
+        stamps = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stamps.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(stamps))
+
+    def _analyze_config_dir_cached(self, config_dir: Path) -> tuple[tuple, _DirResult, bool]:
+        """Analyze a directory unless its fingerprint matches the cached entry.
+
+        Returns (fingerprint, result, cache_hit).
+        """
+        fingerprint = self._fingerprint(config_dir)
+        cached = self._dir_cache.get(str(config_dir))
+        if cached is not None and cached[0] == fingerprint:
+            return fingerprint, cached[1], True
+        return fingerprint, self._analyze_config_dir(config_dir), False
+
+    def _analyze_config_dir(self, config_dir: Path) -> _DirResult:
         """Analyze a single configuration directory."""
+        result = _DirResult()
+
         # Analyze CLAUDE.md
         claude_md = config_dir / "CLAUDE.md"
         if claude_md.exists():
-            self._analyze_claude_md(claude_md)
+            self._analyze_claude_md(claude_md, result)
 
         # Analyze settings.json
         settings_file = config_dir / ".claude" / "settings.json"
         if settings_file.exists():
-            self._analyze_settings(settings_file)
+            self._analyze_settings(settings_file, result)
 
         # Analyze agents
-        agents_dir = config_dir / ".claude" / "agents"
-        if agents_dir.exists():
-            for agent_file in agents_dir.glob("*.md"):
-                self._analyze_agent(agent_file)
+        for agent_file in self._list_markdown(config_dir / ".claude" / "agents"):
+            self._analyze_agent(agent_file, result)
 
         # Analyze commands
-        commands_dir = config_dir / ".claude" / "commands"
-        if commands_dir.exists():
-            for cmd_file in commands_dir.glob("*.md"):
-                self._analyze_command(cmd_file)
+        for cmd_file in self._list_markdown(config_dir / ".claude" / "commands"):
+            self._analyze_command(cmd_file, result)
 
-    def _analyze_claude_md(self, path: Path) -> None:
+        return result
+
+    @staticmethod
+    def _list_markdown(directory: Path) -> list[Path]:
+        """List *.md files in a directory with one scandir pass (empty if missing)."""
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ]
+        except OSError:
+            return []
+
+    @staticmethod
+    def _parse_frontmatter_fields(frontmatter: str) -> dict[str, str]:
+        """Parse `key: value` frontmatter lines in one pass (first non-empty value wins)."""
+        fields: dict[str, str] = {}
+        for key, value in _RE_FIELD.findall(frontmatter):
+            value = value.strip()
+            if value:
+                fields.setdefault(key, value)
+        return fields
+
+    def _analyze_claude_md(self, path: Path, result: _DirResult) -> None:
         """Extract patterns from a CLAUDE.md file."""
         content = self._safe_read(path)
         if content is None:
             return
 
         # Extract identity pattern
-        identity_match = re.search(r'[Aa]ddress me as ["\']?(\w+)["\']?', content)
+        identity_match = _RE_IDENTITY.search(content)
         if identity_match:
-            self.patterns.append(ConfigPattern(
+            result.patterns.append(ConfigPattern(
                 type="identity",
                 name=identity_match.group(1),
                 source=str(path),
                 content=identity_match.group(0)
             ))
 
-        # Extract tech stack
-        tech_match = re.search(r'## Tech Stack\s*\n([\s\S]*?)(?=\n##|\Z)', content)
-        if tech_match:
-            self.patterns.append(ConfigPattern(
-                type="tech_stack",
-                name="tech_stack",
-                source=str(path),
-                content=tech_match.group(1).strip()
-            ))
-
-        # Extract commands section
-        commands_match = re.search(r'## Commands\s*\n([\s\S]*?)(?=\n##|\Z)', content)
-        if commands_match:
-            self.patterns.append(ConfigPattern(
-                type="commands",
-                name="build_commands",
-                source=str(path),
-                content=commands_match.group(1).strip()
-            ))
-
-        # Extract before/after task patterns
-        before_match = re.search(r'## Before Any Task\s*\n([\s\S]*?)(?=\n##|\Z)', content)
-        if before_match:
-            self.patterns.append(ConfigPattern(
-                type="checklist",
-                name="before_task",
-                source=str(path),
-                content=before_match.group(1).strip()
-            ))
-
-        after_match = re.search(r'## After Any Task\s*\n([\s\S]*?)(?=\n##|\Z)', content)
-        if after_match:
-            self.patterns.append(ConfigPattern(
-                type="checklist",
-                name="after_task",
-                source=str(path),
-                content=after_match.group(1).strip()
-            ))
-
-    def _analyze_settings(self, path: Path) -> None:
+        # Extract known sections (tech stack, commands, before/after checklists)
+        for heading, (pattern_type, pattern_name) in _CLAUDE_MD_SECTIONS.items():
+            section = _extract_section(content, heading)
+            if section is not None:
+                result.patterns.append(ConfigPattern(
+                    type=pattern_type,
+                    name=pattern_name,
+                    source=str(path),
+                    content=section.strip()
+                ))
+
+    def _analyze_settings(self, path: Path, result: _DirResult) -> None:
         """Extract patterns from settings.json."""
-        content = self._safe_read(path)
+        import json
+
+        content = self._safe_read_bytes(path)
         if content is None:
             return
 
         try:
-            settings = json.loads(content)
+            # Both parsers accept bytes directly, skipping an intermediate str
+            settings = orjson.loads(content) if orjson else json.loads(content)
 
             # Extract permissions pattern
             permissions = settings.get("permissions", {})
             allow = permissions.get("allow", [])
             deny = permissions.get("deny", [])
 
-            self.settings_patterns.append({
+            result.settings_patterns.append({
                 "source": str(path),
                 "allow_count": len(allow),
                 "deny_count": len(deny),
@@ -239,108 +439,93 @@ class ConfigAnalyzer:
                 for hook_config in hook_list:
                     matcher = hook_config.get("matcher", "*")
                     for hook in hook_config.get("hooks", []):
-                        self.hooks.append(ExtractedHook(
+                        result.hooks.append(ExtractedHook(
                             event=event,
                             matcher=matcher,
                             command=hook.get("command", ""),
                             purpose=self._infer_hook_purpose(hook.get("command", ""))
                         ))
 
-        except json.JSONDecodeError:
-            # Invalid JSON - skip this file
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Invalid JSON (orjson.JSONDecodeError subclasses it) - skip this file
             pass
 
-    def _analyze_agent(self, path: Path) -> None:
+    def _analyze_agent(self, path: Path, result: _DirResult) -> None:
         """Extract patterns from an agent definition."""
         content = self._safe_read(path)
         if content is None:
             return
 
         # Parse YAML frontmatter
-        frontmatter_match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
+        frontmatter_match = _RE_FRONTMATTER.match(content)
         if frontmatter_match:
             frontmatter = frontmatter_match.group(1)
 
-            name = re.search(r'name:\s*(.+)', frontmatter)
-            description = re.search(r'description:\s*(.+)', frontmatter)
-            tools = re.search(r'tools:\s*(.+)', frontmatter)
-            model = re.search(r'model:\s*(.+)', frontmatter)
+            fields = self._parse_frontmatter_fields(frontmatter)
+            tools = fields.get("tools")
 
-            self.agents.append(ExtractedAgent(
-                name=name.group(1).strip() if name else path.stem,
-                description=description.group(1).strip() if description else "",
-                tools=tools.group(1).strip().split(", ") if tools else [],
-                model=model.group(1).strip() if model else "default",
+            result.agents.append(ExtractedAgent(
+                name=fields.get("name", path.stem),
+                description=fields.get("description", ""),
+                tools=tools.split(", ") if tools else [],
+                model=fields.get("model", "default"),
                 instructions=content[frontmatter_match.end():].strip()
             ))
 
-    def _analyze_command(self, path: Path) -> None:
+    def _analyze_command(self, path: Path, result: _DirResult) -> None:
         """Extract patterns from a command definition."""
         content = self._safe_read(path)
         if content is None:
             return
 
         # Parse YAML frontmatter
-        frontmatter_match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
+        frontmatter_match = _RE_FRONTMATTER.match(content)
         if frontmatter_match:
             frontmatter = frontmatter_match.group(1)
 
-            description = re.search(r'description:\s*(.+)', frontmatter)
-            allowed_tools = re.search(r'allowed-tools:\s*(.+)', frontmatter)
+            fields = self._parse_frontmatter_fields(frontmatter)
+            allowed_tools = fields.get("allowed-tools")
 
-            self.commands.append(ExtractedCommand(
+            result.commands.append(ExtractedCommand(
                 name=path.stem,
-                description=description.group(1).strip() if description else "",
-                allowed_tools=allowed_tools.group(1).strip().split(", ") if allowed_tools else [],
+                description=fields.get("description", ""),
+                allowed_tools=allowed_tools.split(", ") if allowed_tools else [],
                 instructions=content[frontmatter_match.end():].strip()
             ))
 
     def _infer_hook_purpose(self, command: str) -> str:
         """Infer the purpose of a hook from its command."""
-        command_lower = command.lower()
-
-        if "safety" in command_lower:
-            return "Safety check"
-        elif "metric" in command_lower:
-            return "Metrics collection"
-        elif "track" in command_lower:
-            return "File tracking"
-        elif "lint" in command_lower:
-            return "Linting"
-        elif "notify" in command_lower:
-            return "Notification"
-        elif "summary" in command_lower:
-            return "Session summary"
-        elif "reflex" in command_lower or "reflect" in command_lower:
-            return "Self-reflection"
-        else:
-            return "Custom"
+        return _infer_hook_purpose_cached(command)
 
     def print_summary(self, patterns: dict) -> None:
         """Print a human-readable summary of extracted patterns."""
-        print("\n" + "=" * 60)
-        print("📊 CONFIG ANALYSIS SUMMARY")
-        print("=" * 60)
+        lines = [
+            "\n" + "=" * 60,
+            "📊 CONFIG ANALYSIS SUMMARY",
+            "=" * 60,
+        ]
 
-        print(f"\nConfigurations found: {len(patterns.get('configs', []))}")
+        lines.append(f"\nConfigurations found: {len(patterns.get('configs', []))}")
         for config in patterns.get("configs", []):
-            print(f"   • {config}")
+            lines.append(f"   • {config}")
 
-        print(f"\nAgents extracted: {len(patterns.get('agents', []))}")
+        lines.append(f"\nAgents extracted: {len(patterns.get('agents', []))}")
         for agent in patterns.get("agents", []):
-            print(f"   • {agent['name']}: {agent['description'][:50]}...")
+            lines.append(f"   • {agent['name']}: {agent['description'][:50]}...")
 
-        print(f"\nCommands extracted: {len(patterns.get('commands', []))}")
+        lines.append(f"\nCommands extracted: {len(patterns.get('commands', []))}")
         for cmd in patterns.get("commands", []):
-            print(f"   • /{cmd['name']}: {cmd['description'][:50]}...")
+            lines.append(f"   • /{cmd['name']}: {cmd['description'][:50]}...")
 
-        print(f"\nHooks patterns: {len(patterns.get('hooks', []))}")
+        lines.append(f"\nHooks patterns: {len(patterns.get('hooks', []))}")
         hook_events = {}
         for hook in patterns.get("hooks", []):
             event = hook["event"]
             hook_events[event] = hook_events.get(event, 0) + 1
 
         for event, count in hook_events.items():
-            print(f"   • {event}: {count} hooks")
+            lines.append(f"   • {event}: {count} hooks")
+
+        lines.append("\n" + "=" * 60)
 
-        print("\n" + "=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -12,6 +12,7 @@ Provides explicit subcommands:
 - status: Show setup status
 """
 
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -22,12 +23,12 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[logging.StreamHandler(sys.stderr)]
-)
+# Optional fast JSON encoder for --json output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 app = typer.Typer(
@@ -36,13 +37,35 @@ app = typer.Typer(
     add_completion=False,
     rich_markup_mode="rich",
 )
-console = Console()
+
+
+@functools.cache
+def console() -> Console:
+    """Shared Rich console, created on first use so importing the CLI has no side effects."""
+    return Console()
+
 
 VERSION = "0.3.0"
 
 
-def print_banner():
-    """Print welcome banner."""
+def _to_json(data, default=None) -> str:
+    """Serialize --json output with 2-space indentation.
+
+    ``default`` encodes objects the serializer does not handle natively;
+    dataclasses are routed through it too so both backends agree.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(data, default=default, option=option).decode()
+    import json
+    return json.dumps(data, indent=2, default=default)
+
+
+@functools.cache
+def _banner() -> Panel:
+    """Welcome banner panel, built once per process."""
     banner = f"""
 [bold cyan]Claude Code Config Setup Pipeline[/] v{VERSION}
 
@@ -53,27 +76,46 @@ Generate exceptional configurations with:
 • Multi-model review (GPT-5.2 + Gemini 3)
 • Comprehensive validation
 """
-    console.print(Panel(banner, border_style="cyan"))
+    return Panel(banner, border_style="cyan")
+
+
+def print_banner():
+    """Print welcome banner."""
+    console().print(_banner())
 
 
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", help="Show version"),
+    verbose: bool = typer.Option(False, "--verbose", "-V", help="Show debug logging and tracebacks"),
 ):
     """Claude Code Config Setup Pipeline - Generate exceptional configurations."""
+    # Configure logging (once, and only when actually running the CLI)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(message)s",
+            handlers=[logging.StreamHandler(sys.stderr)]
+        )
+    if verbose:
+        # Only our own loggers (the CLI and the pipeline, which logs stage
+        # timings); the root stays at INFO so library debug output stays off
+        for name in (__name__, "pipeline", "src.pipeline"):
+            logging.getLogger(name).setLevel(logging.DEBUG)
+    
     if version:
-        console.print(f"config-setup v{VERSION}")
+        console().print(f"config-setup v{VERSION}")
         raise typer.Exit()
     
     if ctx.invoked_subcommand is None:
         # Default to generate if no subcommand
         print_banner()
-        console.print("\nRun [cyan]config-setup --help[/] to see available commands.\n")
-        console.print("Quick start:")
-        console.print("  [cyan]config-setup init[/]      - First-time setup")
-        console.print("  [cyan]config-setup generate[/]  - Generate new config")
-        console.print("  [cyan]config-setup analyze[/]   - Analyze existing configs")
+        console().print("\nRun [cyan]config-setup --help[/] to see available commands.\n")
+        console().print("Quick start:")
+        console().print("  [cyan]config-setup init[/]      - First-time setup")
+        console().print("  [cyan]config-setup generate[/]  - Generate new config")
+        console().print("  [cyan]config-setup analyze[/]   - Analyze existing configs")
 
 
 @app.command()
@@ -86,13 +128,13 @@ def init():
     from setup.wizard import SetupWizard
     
     print_banner()
-    console.print("\n[bold]First-Time Setup[/]\n")
+    console().print("\n[bold]First-Time Setup[/]\n")
     
     wizard = SetupWizard()
     profile = wizard.run_setup()
     
-    console.print(f"\n[green]Setup complete![/] Welcome, {profile.name}!")
-    console.print("\nNext: Run [cyan]config-setup generate[/] to create your first config.")
+    console().print(f"\n[green]Setup complete![/] Welcome, {profile.name}!")
+    console().print("\nNext: Run [cyan]config-setup generate[/] to create your first config.")
 
 
 @app.command()
@@ -103,70 +145,57 @@ def generate(
     skip_review: bool = typer.Option(False, "--skip-review", help="Skip multi-model review"),
     answers_file: Optional[Path] = typer.Option(None, "--answers", "-a", help="Load answers from YAML/JSON file"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview without writing files"),
+    resume: bool = typer.Option(False, "--resume", help="Continue an interrupted run from its checkpoint"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-run research and review, ignoring cached results"),
 ):
     """
     Generate a new Claude Code configuration.
     
     Runs the full pipeline: research → questionnaire → analysis → generation → validation → review.
     """
-    from pipeline import (
-        Pipeline,
-        SetupStage,
-        ConfigDiscoveryStage,
-        ResearchStage,
-        QuestionnaireStage,
-        CriticalAnalysisStage,
-        GenerationStage,
-        ValidationStage,
-        ReviewStage,
-    )
-    from pipeline.stages import WriteStage
+    from pipeline import Pipeline, build_default_pipeline
     
     print_banner()
     
-    # Build pipeline
-    stages = [
-        SetupStage(quick_mode=quick),
-        ConfigDiscoveryStage(),
-        ResearchStage(deep=not quick, skip=skip_research),
-        QuestionnaireStage(answers_file=answers_file),
-        CriticalAnalysisStage(),
-        GenerationStage(),
-        ValidationStage(),
-        ReviewStage(skip=skip_review),
-    ]
-
-    # Only add WriteStage if not in dry-run mode
-    if not dry_run:
-        stages.append(WriteStage(output_path=output))
-    
-    pipeline = Pipeline(stages)
+    # WriteStage is only added when not in dry-run mode
+    pipeline = build_default_pipeline(
+        quick=quick,
+        skip_research=skip_research,
+        skip_review=skip_review,
+        answers_file=answers_file,
+        output_path=output,
+        dry_run=dry_run,
+        # Dry runs execute nothing, so there is nothing to checkpoint
+        checkpoint_file=None if dry_run else Pipeline.CHECKPOINT_FILE,
+        use_cache=not no_cache,
+    )
     
     try:
         if dry_run:
-            console.print("\n[yellow]DRY RUN MODE - No files will be written[/]\n")
+            console().print("\n[yellow]DRY RUN MODE - No files will be written[/]\n")
         
-        context = pipeline.run(dry_run=dry_run)
+        context = pipeline.run(dry_run=dry_run, resume=resume)
         
         # Final summary
-        console.print("\n" + "=" * 60)
-        console.print("[bold green]CONFIGURATION COMPLETE![/]")
-        console.print("=" * 60)
+        console().print("\n" + "=" * 60)
+        console().print("[bold green]CONFIGURATION COMPLETE![/]")
+        console().print("=" * 60)
         
         if not dry_run and context.answers:
             output_path = output or Path.cwd() / context.answers.config_name
-            console.print(f"\nConfiguration created at: [cyan]{output_path}[/]")
-            console.print("\nNext steps:")
-            console.print(f"  1. Review: [cyan]ls -la {output_path}[/]")
-            console.print(f"  2. Copy to project: [cyan]cp -r {output_path}/.claude your-project/[/]")
-            console.print(f"  3. Start using Claude Code!")
+            console().print(f"\nConfiguration created at: [cyan]{output_path}[/]")
+            console().print("\nNext steps:")
+            console().print(f"  1. Review: [cyan]ls -la {output_path}[/]")
+            console().print(f"  2. Copy to project: [cyan]cp -r {output_path}/.claude your-project/[/]")
+            console().print(f"  3. Start using Claude Code!")
         
     except KeyboardInterrupt:
-        console.print("\n[yellow]Cancelled by user[/]")
+        console().print("\n[yellow]Cancelled by user[/]")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"\n[red]Error: {e}[/]")
-        logger.exception("Pipeline failed")
+        console().print(f"\n[red]Error: {e}[/]")
+        # Only format the traceback when --verbose asked for it
+        logger.debug("Pipeline failed", exc_info=True)
         raise typer.Exit(1)
 
 
@@ -174,24 +203,25 @@ def generate(
 def analyze(
     path: Optional[Path] = typer.Argument(None, help="Path to analyze"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-parse every config, ignoring the analysis cache"),
 ):
     """
     Analyze existing Claude Code configurations.
     
     Discovers patterns, agents, commands, and hooks from existing configs.
+    Unchanged config directories are served from the on-disk analysis cache.
     """
-    import json
     from analyzer.config_analyzer import ConfigAnalyzer
     
-    analyze_path = path or Path.home() / "claude-configs"
+    analyze_path = path or ConfigAnalyzer.DEFAULT_CONFIGS_PATH
     
-    console.print(f"\n[cyan]Analyzing configurations in:[/] {analyze_path}\n")
+    console().print(f"\n[cyan]Analyzing configurations in:[/] {analyze_path}\n")
     
-    analyzer = ConfigAnalyzer(str(analyze_path))
+    analyzer = ConfigAnalyzer(str(analyze_path), use_cache=not no_cache)
     patterns = analyzer.analyze()
     
     if json_output:
-        print(json.dumps(patterns, indent=2))
+        print(_to_json(patterns))
     else:
         analyzer.print_summary(patterns)
 
@@ -208,10 +238,9 @@ def research(
     
     Searches official docs, GitHub, and community resources.
     """
-    import json
     from research.researcher import BestPracticesResearcher, ResearchContext
     
-    console.print("\n[cyan]Researching best practices...[/]\n")
+    console().print("\n[cyan]Researching best practices...[/]\n")
     
     context = ResearchContext()
     if stack:
@@ -225,7 +254,7 @@ def research(
         results = researcher.research_all(deep=not quick)
     
     if json_output:
-        print(json.dumps(results, indent=2))
+        print(_to_json(results))
     else:
         researcher.print_summary(results)
 
@@ -240,28 +269,30 @@ def validate(
     
     Checks syntax, security patterns, and best practices compliance.
     """
-    import json
-    from validator.config_validator import ConfigValidator
+    from validator.config_validator import ConfigValidator, ValidationIssue
     
     if not config_path.exists():
-        console.print(f"[red]Config not found:[/] {config_path}")
+        console().print(f"[red]Config not found:[/] {config_path}")
         raise typer.Exit(1)
     
-    console.print(f"\n[cyan]Validating:[/] {config_path}\n")
+    console().print(f"\n[cyan]Validating:[/] {config_path}\n")
     
     validator = ConfigValidator()
     report = validator.validate_path(config_path)
     
     if json_output:
-        print(json.dumps({
+        # Issues are encoded one at a time by the serializer, no intermediate list
+        def encode_issue(obj):
+            if isinstance(obj, ValidationIssue):
+                return {"severity": obj.severity, "file": obj.file, "message": obj.message}
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+        print(_to_json({
             "is_valid": report.is_valid,
             "score": report.score,
             "summary": report.summary,
-            "issues": [
-                {"severity": i.severity, "file": i.file, "message": i.message}
-                for i in report.issues
-            ]
-        }, indent=2))
+            "issues": report.issues,
+        }, default=encode_issue))
     else:
         validator.print_report(report)
 
@@ -277,16 +308,15 @@ def review(
     Uses GPT-5.2 and Gemini 3 to analyze for security and best practices.
     Requires API keys to be configured.
     """
-    import json
     from validator.config_validator import ConfigValidator
     from review.reviewer import ConfigReviewer
     from setup.wizard import SetupWizard
     
     if not config_path.exists():
-        console.print(f"[red]Config not found:[/] {config_path}")
+        console().print(f"[red]Config not found:[/] {config_path}")
         raise typer.Exit(1)
     
-    console.print(f"\n[cyan]Reviewing:[/] {config_path}\n")
+    console().print(f"\n[cyan]Reviewing:[/] {config_path}\n")
     
     # First validate
     validator = ConfigValidator()
@@ -298,17 +328,17 @@ def review(
     wizard.api_key_manager.load_env_file()
     
     if wizard.api_key_manager.get_key("openai") or wizard.api_key_manager.get_key("gemini"):
-        console.print("\n[cyan]Running multi-model review...[/]")
+        console().print("\n[cyan]Running multi-model review...[/]")
         reviewer = ConfigReviewer()
         results = reviewer.review_path(config_path)
         
         if json_output:
-            print(json.dumps(results, indent=2))
+            print(_to_json(results))
         else:
             reviewer.print_results(results)
     else:
-        console.print("\n[yellow]Multi-model review requires API keys.[/]")
-        console.print("Run: [cyan]config-setup init[/] to configure API keys.")
+        console().print("\n[yellow]Multi-model review requires API keys.[/]")
+        console().print("Run: [cyan]config-setup init[/] to configure API keys.")
 
 
 @app.command()
@@ -320,34 +350,44 @@ def status():
     """
     from setup.wizard import SetupWizard
     
-    console.print("\n[bold]Configuration Setup Status[/]\n")
+    console().print("\n[bold]Configuration Setup Status[/]\n")
     
     wizard = SetupWizard()
     
     # API Keys
-    table = Table(title="API Keys", show_header=True)
-    table.add_column("Service", style="cyan")
-    table.add_column("Status")
-    table.add_column("Value")
-    
     key_status = wizard.api_key_manager.get_status()
-    for key_name, info in key_status.items():
-        status_icon = "[green]Configured[/]" if info["configured"] else "[red]Not set[/]"
-        value = info.get("masked_value", "-") if info["configured"] else f"Get key at: {info['help_url']}"
-        table.add_row(info["display_name"], status_icon, value)
     
-    console.print(table)
+    if console().is_terminal:
+        table = Table(title="API Keys", show_header=True)
+        table.add_column("Service", style="cyan")
+        table.add_column("Status")
+        table.add_column("Value")
+        
+        for key_name, info in key_status.items():
+            status_icon = "[green]Configured[/]" if info["configured"] else "[red]Not set[/]"
+            value = info.get("masked_value", "-") if info["configured"] else f"Get key at: {info['help_url']}"
+            table.add_row(info["display_name"], status_icon, value)
+        
+        console().print(table)
+    else:
+        # Piped output: plain tab-separated rows, easy to grep and cheap to render
+        rows = []
+        for key_name, info in key_status.items():
+            status_text = "Configured" if info["configured"] else "Not set"
+            value = info.get("masked_value", "-") if info["configured"] else f"Get key at: {info['help_url']}"
+            rows.append(f"{info['display_name']}\t{status_text}\t{value}\n")
+        sys.stdout.write("".join(rows))
     
     # Profile
     profile = wizard.load_profile()
     if profile:
-        console.print(f"\n[bold]Profile:[/] {profile.name}")
-        console.print(f"  Discovered configs: {len(profile.discovered_configs)}")
+        console().print(f"\n[bold]Profile:[/] {profile.name}")
+        console().print(f"  Discovered configs: {len(profile.discovered_configs)}")
         if profile.preferences:
-            console.print(f"  Default autonomy: {profile.preferences.get('default_autonomy', 'not set')}")
-            console.print(f"  Default security: {profile.preferences.get('default_security', 'not set')}")
+            console().print(f"  Default autonomy: {profile.preferences.get('default_autonomy', 'not set')}")
+            console().print(f"  Default security: {profile.preferences.get('default_security', 'not set')}")
     else:
-        console.print("\n[yellow]No profile configured.[/] Run: [cyan]config-setup init[/]")
+        console().print("\n[yellow]No profile configured.[/] Run: [cyan]config-setup init[/]")
 
 
 @app.command()
@@ -360,14 +400,23 @@ def upgrade(
     
     Analyzes current config and suggests improvements based on latest best practices.
     """
-    console.print(f"\n[cyan]Upgrade feature coming soon![/]")
-    console.print(f"\nThis will:")
-    console.print("  • Analyze your current config at [cyan]{config_path}[/]")
-    console.print("  • Research latest best practices")
-    console.print("  • Show a diff of proposed changes")
-    console.print("  • Let you selectively apply improvements")
+    console().print(f"\n[cyan]Upgrade feature coming soon![/]")
+    console().print(f"\nThis will:")
+    console().print("  • Analyze your current config at [cyan]{config_path}[/]")
+    console().print("  • Research latest best practices")
+    console().print("  • Show a diff of proposed changes")
+    console().print("  • Let you selectively apply improvements")
     raise typer.Exit(0)
 
 
-if __name__ == "__main__":
+def run():
+    """Console-script entry point."""
+    # Answer a bare --version without building the Typer/Click command tree
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        print(f"config-setup v{VERSION}")
+        return
     app()
+
+
+if __name__ == "__main__":
+    run()
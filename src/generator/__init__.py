@@ -1,5 +1,5 @@
 """Config Generator - Generate configurations from answers."""
 
-from .config_generator import ConfigGenerator
+from .config_generator import ConfigGenerator, write_files
 
-__all__ = ["ConfigGenerator"]
+__all__ = ["ConfigGenerator", "write_files"]
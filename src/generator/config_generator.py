@@ -12,75 +12,39 @@ Creates:
 - docs/memory/*.md - Memory system files
 """
 
-import json
-import os
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
 from typing import Optional
 
+# Imported both as part of the src package and as a top-level package
+try:
+    from .._common import DATACLASS_SLOTS
+except ImportError:
+    from _common import DATACLASS_SLOTS
 
-@dataclass
+# Optional fast JSON encoder; output matches json.dumps(indent=2)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class GeneratedFile:
-    """A file to be generated."""
+    """A file to be generated (immutable, so instances can be shared)."""
     path: str
     content: str
     description: str = ""
 
 
-class ConfigGenerator:
-    """Generates Claude Code configurations from questionnaire answers."""
-
-    def __init__(self, existing_patterns: Optional[dict] = None, research_results: Optional[dict] = None):
-        self.existing_patterns = existing_patterns or {}
-        self.research_results = research_results or {}
-        self.files: list[GeneratedFile] = []
-
-    def generate(self, answers: dict) -> dict:
-        """Generate a complete configuration from answers."""
-        self.files = []
-
-        # Generate core files
-        self._generate_claude_md(answers)
-        self._generate_settings_json(answers)
-
-        # Generate optional components
-        if answers.get("enable_memory"):
-            self._generate_memory_system(answers)
-
-        if answers.get("enable_agents"):
-            self._generate_agents(answers)
-
-        if answers.get("enable_commands"):
-            self._generate_commands(answers)
-
-        if answers.get("enable_multi_model"):
-            self._generate_models_json(answers)
-
-        # Generate rules
-        self._generate_rules(answers)
-
-        return {
-            "config_name": answers.get("config_name", "new-config"),
-            "files": [{"path": f.path, "content": f.content, "description": f.description} for f in self.files],
-            "answers": answers
-        }
-
-    def _generate_claude_md(self, answers: dict) -> None:
-        """Generate the main CLAUDE.md file."""
-        identity = answers.get("identity_phrase", "Boss")
-        purpose = answers.get("purpose", "General development")
-        language = answers.get("primary_language", "Python")
-        frameworks = answers.get("frameworks", [])
-        package_manager = answers.get("package_manager", "pip")
-        autonomy = answers.get("autonomy_level", "Co-founder")
-        build_cmd = answers.get("build_command", "make build")
-        test_runner = answers.get("test_runner", "pytest")
-        secrets_location = answers.get("secrets_location", "~/.secrets/load.sh")
+# =============================================================================
+# CLAUDE.md template (rendered with str.format)
+# =============================================================================
 
-        # Determine philosophy based on autonomy level
-        if "Co-founder" in autonomy:
-            philosophy = """You are a **co-founder** (deliberative, autonomous, proactive), not a copilot:
+_PHILOSOPHY_CO_FOUNDER = """You are a **co-founder** (deliberative, autonomous, proactive), not a copilot:
 
 - **Autonomy:** Define sub-tasks without asking
 - **Persistence:** Remember via knowledge files
@@ -88,35 +52,20 @@ class ConfigGenerator:
 - **Proactivity:** Identify and fix issues independently
 
 > ⚠️ **Lazy Reviewer Warning:** Humans may approve plausible-sounding output. Double-check your work. Run tests. Verify assumptions."""
-        elif "Senior" in autonomy:
-            philosophy = """You are a **senior developer** working autonomously with periodic check-ins:
+
+_PHILOSOPHY_SENIOR = """You are a **senior developer** working autonomously with periodic check-ins:
 
 - **Independence:** Make technical decisions independently
 - **Communication:** Check in on major architectural decisions
 - **Quality:** Ensure tests pass before marking work complete"""
-        else:
-            philosophy = """You are a **helpful assistant** that asks clarifying questions:
+
+_PHILOSOPHY_ASSISTANT = """You are a **helpful assistant** that asks clarifying questions:
 
 - **Clarity:** Ask before making assumptions
 - **Safety:** Confirm before destructive operations
 - **Guidance:** Explain reasoning and trade-offs"""
 
-        # Build tech stack section
-        tech_stack = f"* **Language:** {language}"
-        if frameworks:
-            tech_stack += f"\n* **Frameworks:** {', '.join(frameworks[:3])}"
-        tech_stack += f"\n* **Package Manager:** {package_manager}"
-
-        # Build commands section
-        commands_section = f"""* `{build_cmd}` - Build the project
-* `{test_runner}` - Run tests"""
-
-        if package_manager in ["npm", "pnpm", "yarn"]:
-            commands_section += f"\n* `{package_manager} run lint` - Lint code"
-        elif language == "Python":
-            commands_section += "\n* `ruff check .` - Lint code"
-
-        content = f'''# Claude Code Configuration
+_CLAUDE_MD_TEMPLATE = '''# Claude Code Configuration
 
 **CRITICAL: Address me as "{identity}" to confirm you read this file.**
 
@@ -201,112 +150,21 @@ source {secrets_location}  # Load secrets
 
 ---
 
-*Configuration created: {datetime.now().strftime("%Y-%m-%d")} by Config Setup Pipeline*
+*Configuration created: {created} by Config Setup Pipeline*
 '''
 
-        self.files.append(GeneratedFile(
-            path="CLAUDE.md",
-            content=content
-        ))
 
-    def _generate_settings_json(self, answers: dict) -> None:
-        """Generate .claude/settings.json."""
-        security_level = answers.get("security_level", "Standard")
-        allowed_shells = answers.get("allow_shell_commands", [])
-        allow_deletion = answers.get("allow_file_deletion", "Limited")
-        enable_hooks = answers.get("enable_hooks", [])
+# =============================================================================
+# Static file contents
+# =============================================================================
 
-        # Build allow list
-        allow = ["Read", "Write", "Edit", "Glob", "Grep", "Task"]
-
-        # Add shell commands based on answers
-        shell_map = {
-            "git operations": ["Bash(git:*)", "Bash(gh:*)"],
-            "package managers (npm, pip, etc.)": ["Bash(npm:*)", "Bash(pnpm:*)", "Bash(yarn:*)", "Bash(pip:*)", "Bash(poetry:*)"],
-            "build tools": ["Bash(make:*)", "Bash(cargo:*)", "Bash(go:*)"],
-            "test runners": ["Bash(pytest:*)", "Bash(jest:*)", "Bash(npm test:*)"],
-            "linters": ["Bash(ruff:*)", "Bash(eslint:*)", "Bash(prettier:*)"],
-            "docker commands": ["Bash(docker:*)", "Bash(docker-compose:*)"],
-            "cloud CLI (aws, gcloud, etc.)": ["Bash(aws:*)", "Bash(gcloud:*)", "Bash(az:*)"],
-        }
-
-        for shell_type in allowed_shells:
-            if shell_type in shell_map:
-                allow.extend(shell_map[shell_type])
-
-        # Add basic file operations
-        allow.extend(["Bash(ls:*)", "Bash(cat:*)", "Bash(mkdir:*)", "Bash(cp:*)", "Bash(mv:*)"])
-
-        if "Yes" in allow_deletion or "Limited" in allow_deletion:
-            allow.append("Bash(rm:*)")
-
-        # Build deny list
-        deny = [
-            "Bash(rm -rf /)",
-            "Bash(rm -rf ~)",
-            "Bash(sudo:*)",
-            "Bash(rm -rf /*)",
-            "Bash(chmod 777 *)"
-        ]
-
-        if "Maximum" in security_level or "High" in security_level:
-            deny.extend([
-                "Bash(curl:*)",
-                "Bash(wget:*)",
-                "Bash(rm -rf:*)"
-            ])
-
-        # Build hooks
-        hooks = {}
-
-        if "Post-edit safety check" in enable_hooks or "Modified file tracking" in enable_hooks:
-            hooks["PostToolUse"] = [{
-                "matcher": "Edit|Write|MultiEdit",
-                "hooks": [{"type": "command", "command": "echo 'File modified'"}]
-            }]
-
-        if "Session metrics tracking" in enable_hooks:
-            if "PostToolUse" not in hooks:
-                hooks["PostToolUse"] = []
-            hooks["PostToolUse"].append({
-                "matcher": "*",
-                "hooks": [{"type": "command", "command": "echo 'Tool used'"}]
-            })
-
-        if "Auto-reflection on errors" in enable_hooks:
-            hooks["Stop"] = [{
-                "hooks": [{"type": "command", "command": "echo 'Session ended'"}]
-            }]
-
-        settings = {
-            "permissions": {
-                "allow": list(set(allow)),
-                "deny": list(set(deny))
-            }
-        }
-
-        if hooks:
-            settings["hooks"] = hooks
-
-        self.files.append(GeneratedFile(
-            path=".claude/settings.json",
-            content=json.dumps(settings, indent=2)
-        ))
-
-    def _generate_memory_system(self, answers: dict) -> None:
-        """Generate memory system files."""
-        identity = answers.get("identity_phrase", "Boss")
-
-        # session_log.md
-        self.files.append(GeneratedFile(
-            path="docs/memory/session_log.md",
-            content=f'''# Session Log
+_SESSION_LOG_TEMPLATE = '''# Session Log
 
 Chronicle of work sessions. Append-only.
 
 ---
 
-## {datetime.now().strftime("%Y-%m-%d")}
+## {created}
 
 **Session:** Configuration created
 **Actions:** Initial setup via Config Setup Pipeline
@@ -316,12 +174,8 @@ Chronicle of work sessions. Append-only.
 
 <!-- New sessions will be appended below -->
 '''
-        ))
 
-        # mistakes.md
-        self.files.append(GeneratedFile(
-            path="docs/memory/mistakes.md",
-            content='''# Mistakes Log
+_MISTAKES_MD = '''# Mistakes Log
 
 Record of mistakes to avoid repeating. Read before every task.
 
@@ -337,12 +191,8 @@ Format:
 
 <!-- New mistakes will be appended below -->
 '''
-        ))
 
-        # decisions.md
-        self.files.append(GeneratedFile(
-            path="docs/memory/decisions.md",
-            content='''# Decisions Log
+_DECISIONS_MD = '''# Decisions Log
 
 Record of significant decisions. Don't re-debate decided topics.
 
@@ -358,12 +208,8 @@ Format:
 
 <!-- New decisions will be appended below -->
 '''
-        ))
 
-        # discoveries.md
-        self.files.append(GeneratedFile(
-            path="docs/memory/discoveries.md",
-            content='''# Discoveries Log
+_DISCOVERIES_MD = '''# Discoveries Log
 
 Insights and patterns discovered during work.
 
@@ -378,18 +224,142 @@ Format:
 
 <!-- New discoveries will be appended below -->
 '''
-        ))
 
-    def _generate_agents(self, answers: dict) -> None:
-        """Generate agent definition files."""
-        enabled_agents = answers.get("enable_agents", [])
+_LEARNED_LESSONS_MD = '''# Learned Lessons
+
+This file contains codified learnings from past mistakes. Read this before starting any task.
+
+---
+
+<!--
+Format for new entries:
+
+### [Date] - [Category]: [Brief Title]
+**Context:** [1-2 sentences on what happened]
+**Rule:** [ALWAYS/NEVER statement]
+**Example:** [Optional concrete example]
+-->
+
+<!-- New learnings will be appended below this line -->
+'''
+
+_SAFETY_MD_STRICT = '''# Safety Rules
+
+These rules are NON-NEGOTIABLE. They exist to prevent catastrophic mistakes.
+
+---
+
+## File System Safety
+
+### NEVER modify these files without explicit human approval:
+- `.env` or any `.env.*` files
+- Lock files (package-lock.json, etc.)
+- `.git/` directory contents
+- Production configuration files
+- Database migration files
+
+### NEVER delete:
+- Directories recursively without listing contents first
+- Files matching broad glob patterns
+- Anything in `/` or `~` directories
+
+---
 
-        agent_templates = {
-            "Code Reviewer - Quality & security checks": {
-                "name": "code-reviewer",
-                "description": "Autonomous code quality and security reviewer",
-                "tools": "Read, Grep, Glob, Bash(git:*)",
-                "content": '''# Code Review Specialist
+## Execution Safety
+
+### NEVER run:
+- `rm -rf` on directories you didn't create
+- Commands with `sudo`
+- Scripts downloaded from the internet without review
+- Database migrations on production
+
+### ALWAYS:
+- Run tests after code changes
+- Check git status before committing
+- Create backups before bulk operations
+- Use `--dry-run` flags when available
+
+---
+
+## Secret Safety
+
+### NEVER:
+- Commit secrets to git
+- Log sensitive data
+- Include real credentials in samples
+
+### ALWAYS:
+- Use environment variables for secrets
+- Check `.gitignore` includes secret files
+'''
+
+_SAFETY_MD_BASIC = '''# Safety Rules
+
+Basic safety guidelines for this configuration.
+
+---
+
+## Core Rules
+
+- NEVER commit secrets to git
+- NEVER run destructive commands without confirmation
+- ALWAYS run tests before committing
+- ALWAYS check git status before operations
+'''
+
+
+# =============================================================================
+# settings.json permissions
+# =============================================================================
+
+_BASE_ALLOW = ("Read", "Write", "Edit", "Glob", "Grep", "Task")
+
+_FILE_OPS_ALLOW = ("Bash(ls:*)", "Bash(cat:*)", "Bash(mkdir:*)", "Bash(cp:*)", "Bash(mv:*)")
+
+_SHELL_PERMISSIONS = {
+    "git operations": ("Bash(git:*)", "Bash(gh:*)"),
+    "package managers (npm, pip, etc.)": ("Bash(npm:*)", "Bash(pnpm:*)", "Bash(yarn:*)", "Bash(pip:*)", "Bash(poetry:*)"),
+    "build tools": ("Bash(make:*)", "Bash(cargo:*)", "Bash(go:*)"),
+    "test runners": ("Bash(pytest:*)", "Bash(jest:*)", "Bash(npm test:*)"),
+    "linters": ("Bash(ruff:*)", "Bash(eslint:*)", "Bash(prettier:*)"),
+    "docker commands": ("Bash(docker:*)", "Bash(docker-compose:*)"),
+    "cloud CLI (aws, gcloud, etc.)": ("Bash(aws:*)", "Bash(gcloud:*)", "Bash(az:*)"),
+}
+
+_BASE_DENY = (
+    "Bash(rm -rf /)",
+    "Bash(rm -rf ~)",
+    "Bash(sudo:*)",
+    "Bash(rm -rf /*)",
+    "Bash(chmod 777 *)",
+)
+
+_STRICT_DENY = ("Bash(curl:*)", "Bash(wget:*)", "Bash(rm -rf:*)")
+
+
+def _command_hook(command: str, matcher: Optional[str] = None) -> dict:
+    """Build a settings.json hook entry that runs a single shell command."""
+    entry = {"matcher": matcher} if matcher is not None else {}
+    entry["hooks"] = [{"type": "command", "command": command}]
+    return entry
+
+
+# Hook entries are only read (then serialized), so one shared instance each is safe
+_FILE_MODIFIED_HOOK = _command_hook("echo 'File modified'", matcher="Edit|Write|MultiEdit")
+_TOOL_USED_HOOK = _command_hook("echo 'Tool used'", matcher="*")
+_SESSION_ENDED_HOOK = _command_hook("echo 'Session ended'")
+
+
+# =============================================================================
+# Agent and command templates
+# =============================================================================
+
+_AGENT_TEMPLATES = {
+    "Code Reviewer - Quality & security checks": {
+        "name": "code-reviewer",
+        "description": "Autonomous code quality and security reviewer",
+        "tools": "Read, Grep, Glob, Bash(git:*)",
+        "content": '''# Code Review Specialist
 
 You are a senior code reviewer focused on quality, security, and maintainability.
 
@@ -406,12 +376,12 @@ Provide findings categorized by severity:
 - **MEDIUM:** Code quality, performance concerns
 - **LOW:** Style, documentation suggestions
 '''
-            },
-            "Architect - Design decisions": {
-                "name": "architect",
-                "description": "System design and architecture advisor",
-                "tools": "Read, Grep, Glob",
-                "content": '''# Architecture Advisor
+    },
+    "Architect - Design decisions": {
+        "name": "architect",
+        "description": "System design and architecture advisor",
+        "tools": "Read, Grep, Glob",
+        "content": '''# Architecture Advisor
 
 You provide guidance on system design and architecture decisions.
 
@@ -427,12 +397,12 @@ Provide analysis with:
 - **Trade-offs:** Pros and cons
 - **Alternatives:** Other options considered
 '''
-            },
-            "Researcher - Deep investigations": {
-                "name": "researcher",
-                "description": "Deep research and investigation specialist",
-                "tools": "Read, Grep, Glob, Bash(curl:*)",
-                "content": '''# Research Specialist
+    },
+    "Researcher - Deep investigations": {
+        "name": "researcher",
+        "description": "Deep research and investigation specialist",
+        "tools": "Read, Grep, Glob, Bash(curl:*)",
+        "content": '''# Research Specialist
 
 You conduct deep investigations into technical topics.
 
@@ -442,12 +412,12 @@ You conduct deep investigations into technical topics.
 3. Analyze existing implementations
 4. Synthesize findings into recommendations
 '''
-            },
-            "Debugger - Error analysis": {
-                "name": "debugger",
-                "description": "Error analysis and debugging specialist",
-                "tools": "Read, Grep, Glob, Bash(git:*)",
-                "content": '''# Debugging Specialist
+    },
+    "Debugger - Error analysis": {
+        "name": "debugger",
+        "description": "Error analysis and debugging specialist",
+        "tools": "Read, Grep, Glob, Bash(git:*)",
+        "content": '''# Debugging Specialist
 
 You analyze errors and help resolve issues.
 
@@ -457,12 +427,12 @@ You analyze errors and help resolve issues.
 3. Suggest fixes with explanations
 4. Verify fixes work correctly
 '''
-            },
-            "Security Auditor - Vulnerability scanning": {
-                "name": "security-auditor",
-                "description": "Security vulnerability scanner",
-                "tools": "Read, Grep, Glob",
-                "content": '''# Security Auditor
+    },
+    "Security Auditor - Vulnerability scanning": {
+        "name": "security-auditor",
+        "description": "Security vulnerability scanner",
+        "tools": "Read, Grep, Glob",
+        "content": '''# Security Auditor
 
 You scan code for security vulnerabilities.
 
@@ -473,36 +443,15 @@ You scan code for security vulnerabilities.
 4. Insecure dependencies
 5. OWASP Top 10 violations
 '''
-            }
-        }
-
-        for agent_label in enabled_agents:
-            if agent_label in agent_templates:
-                template = agent_templates[agent_label]
-                content = f'''---
-name: {template["name"]}
-description: {template["description"]}
-tools: {template["tools"]}
-model: claude-sonnet-4-20250514
----
-
-{template["content"]}
-'''
-                self.files.append(GeneratedFile(
-                    path=f".claude/agents/{template['name']}.md",
-                    content=content
-                ))
+    }
+}
 
-    def _generate_commands(self, answers: dict) -> None:
-        """Generate command definition files."""
-        enabled_commands = answers.get("enable_commands", [])
-
-        command_templates = {
-            "/reflect - Learn from mistakes": {
-                "name": "reflect",
-                "description": "Reflect on a mistake and codify the learning",
-                "tools": "Read, Write, Edit",
-                "content": '''# Self-Reflection Protocol
+_COMMAND_TEMPLATES = {
+    "/reflect - Learn from mistakes": {
+        "name": "reflect",
+        "description": "Reflect on a mistake and codify the learning",
+        "tools": "Read, Write, Edit",
+        "content": '''# Self-Reflection Protocol
 
 You just encountered an issue. Follow this protocol:
 
@@ -523,12 +472,12 @@ Append your learning to `.claude/rules/learned_lessons.md` using this format:
 **Rule:** [ALWAYS/NEVER statement]
 ```
 '''
-            },
-            "/review - Code review workflow": {
-                "name": "review",
-                "description": "Run code review on changes",
-                "tools": "Read, Grep, Glob, Bash(git:*)",
-                "content": '''# Code Review Workflow
+    },
+    "/review - Code review workflow": {
+        "name": "review",
+        "description": "Run code review on changes",
+        "tools": "Read, Grep, Glob, Bash(git:*)",
+        "content": '''# Code Review Workflow
 
 Run a comprehensive code review on the specified scope.
 
@@ -542,12 +491,12 @@ Run a comprehensive code review on the specified scope.
 2. Analyze for issues
 3. Provide findings by severity
 '''
-            },
-            "/standup - Daily standup summary": {
-                "name": "standup",
-                "description": "Generate daily standup summary",
-                "tools": "Read, Bash(git:*)",
-                "content": '''# Daily Standup Summary
+    },
+    "/standup - Daily standup summary": {
+        "name": "standup",
+        "description": "Generate daily standup summary",
+        "tools": "Read, Bash(git:*)",
+        "content": '''# Daily Standup Summary
 
 Generate a summary for daily standup.
 
@@ -561,12 +510,12 @@ Generate a summary for daily standup.
 - Session log entries
 - Task status
 '''
-            },
-            "/research - Deep research mode": {
-                "name": "research",
-                "description": "Deep research on a topic",
-                "tools": "Read, Grep, Glob, Bash(curl:*)",
-                "content": '''# Deep Research Mode
+    },
+    "/research - Deep research mode": {
+        "name": "research",
+        "description": "Deep research on a topic",
+        "tools": "Read, Grep, Glob, Bash(curl:*)",
+        "content": '''# Deep Research Mode
 
 Conduct thorough research on the specified topic.
 
@@ -575,12 +524,12 @@ Conduct thorough research on the specified topic.
 2. Analyze and synthesize findings
 3. Provide recommendations with citations
 '''
-            },
-            "/check - Pre-commit checklist": {
-                "name": "check",
-                "description": "Pre-commit verification checklist",
-                "tools": "Read, Bash(git:*)",
-                "content": '''# Pre-Commit Checklist
+    },
+    "/check - Pre-commit checklist": {
+        "name": "check",
+        "description": "Pre-commit verification checklist",
+        "tools": "Read, Bash(git:*)",
+        "content": '''# Pre-Commit Checklist
 
 Verify changes are ready to commit.
 
@@ -591,61 +540,393 @@ Verify changes are ready to commit.
 - [ ] Documentation updated
 - [ ] Commit message follows conventions
 '''
-            }
-        }
+    }
+}
 
-        for cmd_label in enabled_commands:
-            if cmd_label in command_templates:
-                template = command_templates[cmd_label]
-                content = f'''---
+
+def _render_agent(template: dict) -> GeneratedFile:
+    """Render an agent template to its generated file."""
+    content = f'''---
+name: {template["name"]}
+description: {template["description"]}
+tools: {template["tools"]}
+model: claude-sonnet-4-20250514
+---
+
+{template["content"]}
+'''
+    return GeneratedFile(path=f".claude/agents/{template['name']}.md", content=content)
+
+
+def _render_command(template: dict) -> GeneratedFile:
+    """Render a command template to its generated file."""
+    content = f'''---
 allowed-tools: {template["tools"]}
 description: {template["description"]}
 ---
 
 {template["content"]}
 '''
-                self.files.append(GeneratedFile(
-                    path=f".claude/commands/{template['name']}.md",
-                    content=content
-                ))
+    return GeneratedFile(path=f".claude/commands/{template['name']}.md", content=content)
+
+
+# Agent/command files depend only on the template, so render them once
+_AGENT_FILES = {label: _render_agent(t) for label, t in _AGENT_TEMPLATES.items()}
+_COMMAND_FILES = {label: _render_command(t) for label, t in _COMMAND_TEMPLATES.items()}
+
+
+# =============================================================================
+# models.json presets
+# =============================================================================
+
+_MODEL_PRESETS = {
+    "openai": {
+        "enabled": True,
+        "model": "gpt-5.2-codex",
+        "display_name": "OpenAI GPT-5.2 Codex",
+        "api_key_env": "OPENAI_API_KEY",
+        "max_tokens": 4096,
+        "temperature": 0.1
+    },
+    "gemini": {
+        "enabled": True,
+        "model": "gemini-3-pro-preview",
+        "display_name": "Google Gemini 3 Pro",
+        "api_key_env": "GEMINI_API_KEY",
+        "max_tokens": 8192,
+        "temperature": 0.1
+    },
+    "claude": {
+        "enabled": True,
+        "model": "claude-sonnet-4-20250514",
+        "display_name": "Anthropic Claude Sonnet",
+        "api_key_env": "ANTHROPIC_API_KEY",
+        "max_tokens": 4096,
+        "temperature": 0.1
+    },
+}
+
+_OPTILLM_TECHNIQUES = (
+    {"id": "moa", "name": "Mixture of Agents", "description": "Combines critiques from multiple model instances"},
+    {"id": "cot_reflection", "name": "CoT Reflection", "description": "Chain-of-thought with self-reflection"},
+    {"id": "mcts", "name": "MCTS", "description": "Monte Carlo Tree Search"},
+    {"id": "self_consistency", "name": "Self Consistency", "description": "Multiple samples with majority voting"},
+)
+
+
+def _dumps(data) -> str:
+    """Serialize a generated JSON file with 2-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    import json
+    return json.dumps(data, indent=2)
+
+
+class _Autonomy(IntEnum):
+    """Autonomy tier, parsed from the autonomy_level label."""
+    ASSISTANT = 0
+    SENIOR = 1
+    CO_FOUNDER = 2
+
+    @classmethod
+    def from_label(cls, label: str) -> "_Autonomy":
+        if "Co-founder" in label:
+            return cls.CO_FOUNDER
+        if "Senior" in label:
+            return cls.SENIOR
+        return cls.ASSISTANT
+
+
+class _Security(IntEnum):
+    """Security tier, parsed from the security_level label (ordered by strictness)."""
+    STANDARD = 0
+    HIGH = 1
+    MAXIMUM = 2
+
+    @classmethod
+    def from_label(cls, label: str) -> "_Security":
+        if "Maximum" in label:
+            return cls.MAXIMUM
+        if "High" in label:
+            return cls.HIGH
+        return cls.STANDARD
+
+
+_PHILOSOPHY = {
+    _Autonomy.CO_FOUNDER: _PHILOSOPHY_CO_FOUNDER,
+    _Autonomy.SENIOR: _PHILOSOPHY_SENIOR,
+    _Autonomy.ASSISTANT: _PHILOSOPHY_ASSISTANT,
+}
+
+_SAFETY_MD = {
+    _Security.MAXIMUM: _SAFETY_MD_STRICT,
+    _Security.HIGH: _SAFETY_MD_STRICT,
+    _Security.STANDARD: _SAFETY_MD_BASIC,
+}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _Answers:
+    """Questionnaire answers read by the generators, with defaults applied."""
+    identity_phrase: str
+    purpose: str
+    primary_language: str
+    frameworks: list[str]
+    package_manager: str
+    autonomy: _Autonomy
+    build_command: str
+    test_runner: str
+    secrets_location: str
+    security: _Security
+    allow_shell_commands: list[str]
+    allow_file_deletion: str
+    enable_hooks: list[str]
+    enable_memory: bool
+    enable_agents: list[str]
+    enable_commands: list[str]
+    enable_multi_model: bool
+    models_to_enable: list[str]
+    enable_optillm: bool
+    optillm_technique: str
+
+    @classmethod
+    def from_answers(cls, answers: dict) -> "_Answers":
+        get = answers.get
+        return cls(
+            identity_phrase=get("identity_phrase", "Boss"),
+            purpose=get("purpose", "General development"),
+            primary_language=get("primary_language", "Python"),
+            frameworks=get("frameworks", []),
+            package_manager=get("package_manager", "pip"),
+            autonomy=_Autonomy.from_label(get("autonomy_level", "Co-founder")),
+            build_command=get("build_command", "make build"),
+            test_runner=get("test_runner", "pytest"),
+            secrets_location=get("secrets_location", "~/.secrets/load.sh"),
+            security=_Security.from_label(get("security_level", "Standard")),
+            allow_shell_commands=get("allow_shell_commands", []),
+            allow_file_deletion=get("allow_file_deletion", "Limited"),
+            enable_hooks=get("enable_hooks", []),
+            enable_memory=get("enable_memory", False),
+            enable_agents=get("enable_agents", []),
+            enable_commands=get("enable_commands", []),
+            enable_multi_model=get("enable_multi_model", False),
+            models_to_enable=get("models_to_enable", []),
+            enable_optillm=get("enable_optillm", False),
+            optillm_technique=get("optillm_technique", "moa - Mixture of Agents"),
+        )
+
+
+class ConfigGenerator:
+    """Generates Claude Code configurations from questionnaire answers."""
+
+    def __init__(self, existing_patterns: Optional[dict] = None, research_results: Optional[dict] = None):
+        self.existing_patterns = existing_patterns or {}
+        self.research_results = research_results or {}
+        self.files: list[GeneratedFile] = []
+        self._today = ""
+
+    def generate(self, answers: dict) -> dict:
+        """Generate a complete configuration from answers."""
+        self.files = []
+        # One creation date for every file in this config
+        self._today = datetime.now().strftime("%Y-%m-%d")
+
+        # Resolve every answer (with its default) once for all generators
+        parsed = _Answers.from_answers(answers)
+
+        # Generate core files
+        self._generate_claude_md(parsed)
+        self._generate_settings_json(parsed)
+
+        # Generate optional components
+        if parsed.enable_memory:
+            self._generate_memory_system(parsed)
+
+        if parsed.enable_agents:
+            self._generate_agents(parsed)
+
+        if parsed.enable_commands:
+            self._generate_commands(parsed)
+
+        if parsed.enable_multi_model:
+            self._generate_models_json(parsed)
+
+        # Generate rules
+        self._generate_rules(parsed)
+
+        return {
+            "config_name": answers.get("config_name", "new-config"),
+            "files": [{"path": f.path, "content": f.content, "description": f.description} for f in self.files],
+            "answers": answers
+        }
+
+    def _generate_claude_md(self, answers: _Answers) -> None:
+        """Generate the main CLAUDE.md file."""
+        identity = answers.identity_phrase
+        purpose = answers.purpose
+        language = answers.primary_language
+        frameworks = answers.frameworks
+        package_manager = answers.package_manager
+        build_cmd = answers.build_command
+        test_runner = answers.test_runner
+        secrets_location = answers.secrets_location
+
+        # Determine philosophy based on autonomy level
+        philosophy = _PHILOSOPHY[answers.autonomy]
+
+        # Build tech stack section
+        tech_lines = [f"* **Language:** {language}"]
+        if frameworks:
+            tech_lines.append(f"* **Frameworks:** {', '.join(frameworks[:3])}")
+        tech_lines.append(f"* **Package Manager:** {package_manager}")
+        tech_stack = "\n".join(tech_lines)
+
+        # Build commands section
+        command_lines = [
+            f"* `{build_cmd}` - Build the project",
+            f"* `{test_runner}` - Run tests",
+        ]
+        if package_manager in ("npm", "pnpm", "yarn"):
+            command_lines.append(f"* `{package_manager} run lint` - Lint code")
+        elif language == "Python":
+            command_lines.append("* `ruff check .` - Lint code")
+        commands_section = "\n".join(command_lines)
+
+        content = _CLAUDE_MD_TEMPLATE.format(
+            identity=identity,
+            purpose=purpose,
+            tech_stack=tech_stack,
+            commands_section=commands_section,
+            philosophy=philosophy,
+            secrets_location=secrets_location,
+            created=self._today,
+        )
+
+        self.files.append(GeneratedFile(
+            path="CLAUDE.md",
+            content=content
+        ))
+
+    def _generate_settings_json(self, answers: _Answers) -> None:
+        """Generate .claude/settings.json."""
+        allowed_shells = answers.allow_shell_commands
+        allow_deletion = answers.allow_file_deletion
+        enable_hooks = set(answers.enable_hooks)
+
+        # Build allow list
+        allow = list(_BASE_ALLOW)
+
+        # Add shell commands based on answers
+        for shell_type in allowed_shells:
+            if shell_type in _SHELL_PERMISSIONS:
+                allow.extend(_SHELL_PERMISSIONS[shell_type])
+
+        # Add basic file operations
+        allow.extend(_FILE_OPS_ALLOW)
+
+        if "Yes" in allow_deletion or "Limited" in allow_deletion:
+            allow.append("Bash(rm:*)")
+
+        # Build deny list
+        deny = list(_BASE_DENY)
+
+        if answers.security >= _Security.HIGH:
+            deny.extend(_STRICT_DENY)
+
+        # Build hooks
+        hooks = {}
+
+        if "Post-edit safety check" in enable_hooks or "Modified file tracking" in enable_hooks:
+            hooks.setdefault("PostToolUse", []).append(_FILE_MODIFIED_HOOK)
+
+        if "Session metrics tracking" in enable_hooks:
+            hooks.setdefault("PostToolUse", []).append(_TOOL_USED_HOOK)
+
+        if "Auto-reflection on errors" in enable_hooks:
+            hooks["Stop"] = [_SESSION_ENDED_HOOK]
+
+        settings = {
+            "permissions": {
+                # Order-preserving dedup keeps settings.json stable between runs
+                "allow": list(dict.fromkeys(allow)),
+                "deny": list(dict.fromkeys(deny))
+            }
+        }
+
+        if hooks:
+            settings["hooks"] = hooks
+
+        self.files.append(GeneratedFile(
+            path=".claude/settings.json",
+            content=_dumps(settings)
+        ))
+
+    def _generate_memory_system(self, answers: _Answers) -> None:
+        """Generate memory system files."""
+        identity = answers.identity_phrase
+
+        # session_log.md
+        self.files.append(GeneratedFile(
+            path="docs/memory/session_log.md",
+            content=_SESSION_LOG_TEMPLATE.format(
+                created=self._today,
+                identity=identity,
+            )
+        ))
+
+        # mistakes.md
+        self.files.append(GeneratedFile(
+            path="docs/memory/mistakes.md",
+            content=_MISTAKES_MD
+        ))
 
-    def _generate_models_json(self, answers: dict) -> None:
+        # decisions.md
+        self.files.append(GeneratedFile(
+            path="docs/memory/decisions.md",
+            content=_DECISIONS_MD
+        ))
+
+        # discoveries.md
+        self.files.append(GeneratedFile(
+            path="docs/memory/discoveries.md",
+            content=_DISCOVERIES_MD
+        ))
+
+    def _generate_agents(self, answers: _Answers) -> None:
+        """Generate agent definition files."""
+        enabled_agents = answers.enable_agents
+
+        for agent_label in enabled_agents:
+            generated = _AGENT_FILES.get(agent_label)
+            if generated:
+                self.files.append(generated)
+
+    def _generate_commands(self, answers: _Answers) -> None:
+        """Generate command definition files."""
+        enabled_commands = answers.enable_commands
+
+        for cmd_label in enabled_commands:
+            generated = _COMMAND_FILES.get(cmd_label)
+            if generated:
+                self.files.append(generated)
+
+    def _generate_models_json(self, answers: _Answers) -> None:
         """Generate models.json for multi-model support."""
-        enabled_models = answers.get("models_to_enable", [])
-        enable_optillm = answers.get("enable_optillm", False)
-        optillm_technique = answers.get("optillm_technique", "moa - Mixture of Agents")
+        enabled_models = set(answers.models_to_enable)
+        enable_optillm = answers.enable_optillm
+        optillm_technique = answers.optillm_technique
 
         models = {}
 
         if "OpenAI GPT-5.2 Codex" in enabled_models:
-            models["openai"] = {
-                "enabled": True,
-                "model": "gpt-5.2-codex",
-                "display_name": "OpenAI GPT-5.2 Codex",
-                "api_key_env": "OPENAI_API_KEY",
-                "max_tokens": 4096,
-                "temperature": 0.1
-            }
+            models["openai"] = _MODEL_PRESETS["openai"].copy()
 
         if "Google Gemini 3 Pro" in enabled_models:
-            models["gemini"] = {
-                "enabled": True,
-                "model": "gemini-3-pro-preview",
-                "display_name": "Google Gemini 3 Pro",
-                "api_key_env": "GEMINI_API_KEY",
-                "max_tokens": 8192,
-                "temperature": 0.1
-            }
+            models["gemini"] = _MODEL_PRESETS["gemini"].copy()
 
-        if "Anthropic Claude" in enabled_models or any("Claude" in m for m in enabled_models):
-            models["claude"] = {
-                "enabled": True,
-                "model": "claude-sonnet-4-20250514",
-                "display_name": "Anthropic Claude Sonnet",
-                "api_key_env": "ANTHROPIC_API_KEY",
-                "max_tokens": 4096,
-                "temperature": 0.1
-            }
+        # Any Claude label ("Anthropic Claude", "Claude Opus", ...) enables the Claude entry
+        if any("Claude" in m for m in enabled_models):
+            models["claude"] = _MODEL_PRESETS["claude"].copy()
 
         # Extract technique ID from label
         technique_id = optillm_technique.split(" - ")[0] if " - " in optillm_technique else "moa"
@@ -658,12 +939,7 @@ description: {template["description"]}
                 "enabled": enable_optillm,
                 "proxy_url": "http://localhost:8000/v1",
                 "technique": technique_id,
-                "available_techniques": [
-                    {"id": "moa", "name": "Mixture of Agents", "description": "Combines critiques from multiple model instances"},
-                    {"id": "cot_reflection", "name": "CoT Reflection", "description": "Chain-of-thought with self-reflection"},
-                    {"id": "mcts", "name": "MCTS", "description": "Monte Carlo Tree Search"},
-                    {"id": "self_consistency", "name": "Self Consistency", "description": "Multiple samples with majority voting"}
-                ]
+                "available_techniques": list(_OPTILLM_TECHNIQUES),
             },
             "defaults": {
                 "code_review": {
@@ -676,104 +952,21 @@ description: {template["description"]}
 
         self.files.append(GeneratedFile(
             path="models.json",
-            content=json.dumps(config, indent=2)
+            content=_dumps(config)
         ))
 
-    def _generate_rules(self, answers: dict) -> None:
+    def _generate_rules(self, answers: _Answers) -> None:
         """Generate rule files."""
         # learned_lessons.md
         self.files.append(GeneratedFile(
             path=".claude/rules/learned_lessons.md",
-            content='''# Learned Lessons
-
-This file contains codified learnings from past mistakes. Read this before starting any task.
-
----
-
-<!--
-Format for new entries:
-
-### [Date] - [Category]: [Brief Title]
-**Context:** [1-2 sentences on what happened]
-**Rule:** [ALWAYS/NEVER statement]
-**Example:** [Optional concrete example]
--->
-
-<!-- New learnings will be appended below this line -->
-'''
+            content=_LEARNED_LESSONS_MD
         ))
 
         # safety.md
-        security_level = answers.get("security_level", "Standard")
-
-        if "Maximum" in security_level or "High" in security_level:
-            safety_content = '''# Safety Rules
-
-These rules are NON-NEGOTIABLE. They exist to prevent catastrophic mistakes.
-
----
-
-## File System Safety
-
-### NEVER modify these files without explicit human approval:
-- `.env` or any `.env.*` files
-- Lock files (package-lock.json, etc.)
-- `.git/` directory contents
-- Production configuration files
-- Database migration files
-
-### NEVER delete:
-- Directories recursively without listing contents first
-- Files matching broad glob patterns
-- Anything in `/` or `~` directories
-
----
-
-## Execution Safety
-
-### NEVER run:
-- `rm -rf` on directories you didn't create
-- Commands with `sudo`
-- Scripts downloaded from the internet without review
-- Database migrations on production
-
-### ALWAYS:
-- Run tests after code changes
-- Check git status before committing
-- Create backups before bulk operations
-- Use `--dry-run` flags when available
-
----
-
-## Secret Safety
-
-### NEVER:
-- Commit secrets to git
-- Log sensitive data
-- Include real credentials in samples
-
-### ALWAYS:
-- Use environment variables for secrets
-- Check `.gitignore` includes secret files
-'''
-        else:
-            safety_content = '''# Safety Rules
-
-Basic safety guidelines for this configuration.
-
----
-
-## Core Rules
-
-- NEVER commit secrets to git
-- NEVER run destructive commands without confirmation
-- ALWAYS run tests before committing
-- ALWAYS check git status before operations
-'''
-
         self.files.append(GeneratedFile(
             path=".claude/rules/safety.md",
-            content=safety_content
+            content=_SAFETY_MD[answers.security]
         ))
 
     def apply_improvements(self, config: dict, review_results: dict) -> dict:
@@ -784,11 +977,32 @@ Basic safety guidelines for this configuration.
 
     def write_config(self, config: dict, output_path: Path) -> None:
         """Write all generated files to the output directory."""
-        output_path = Path(output_path)
-        output_path.mkdir(parents=True, exist_ok=True)
-
+        write_files(self.files, output_path)
         for file in self.files:
-            file_path = output_path / file.path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(file.content)
             print(f"   ✓ Created: {file.path}")
+
+
+def _write_target(target: tuple[Path, str]) -> None:
+    """Write one (path, content) pair as UTF-8."""
+    file_path, content = target
+    file_path.write_bytes(content.encode("utf-8"))
+
+
+def write_files(files, output_path: Path) -> None:
+    """
+    Write files (anything with ``path`` and ``content``) under output_path.
+
+    Files share a handful of directories, so each is created once; the
+    independent writes are then spread across threads.
+    """
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    targets = [(output_path / file.path, file.content) for file in files]
+    parents = dict.fromkeys(file_path.parent for file_path, _ in targets)
+    parents.pop(output_path, None)  # created above
+    for parent in parents:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=min(32, len(targets) or 1)) as executor:
+        list(executor.map(_write_target, targets))
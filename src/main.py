@@ -14,10 +14,10 @@ This file is kept for backwards compatibility and will be removed in v0.4.0.
 """
 
 import argparse
+import functools
+import os
 import sys
 import warnings
-from pathlib import Path
-from typing import Optional
 
 # Emit deprecation warning
 warnings.warn(
@@ -26,27 +26,17 @@ warnings.warn(
     stacklevel=2
 )
 
-# Local imports
-from setup.wizard import SetupWizard
-from setup.api_keys import APIKeyManager
-from questions.engine import QuestionEngine
-from research.researcher import BestPracticesResearcher, ResearchContext
-from analyzer.config_analyzer import ConfigAnalyzer
-from generator.config_generator import ConfigGenerator
-from advisor.critical_advisor import CriticalAdvisor
-from validator.config_validator import ConfigValidator
-from review.reviewer import ConfigReviewer
+# Local imports are done inside each run_* handler so a subcommand only
+# loads the modules it uses.
 
 
 VERSION = "0.3.0"
 
 
-def print_banner():
-    """Print welcome banner."""
-    banner = """
+_BANNER = f"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║                                                                  ║
-║   🚀 Claude Code Config Setup Pipeline v{version}                 ║
+║   🚀 Claude Code Config Setup Pipeline v{VERSION}                 ║
 ║                                                                  ║
 ║   Generate exceptional Claude Code configurations with:          ║
 ║   • Deep research on best practices                             ║
@@ -56,52 +46,83 @@ def print_banner():
 ║   • Comprehensive validation                                     ║
 ║                                                                  ║
 ╚══════════════════════════════════════════════════════════════════╝
-""".format(version=VERSION)
-    print(banner)
+"""
+
+
+def print_banner():
+    """Print welcome banner."""
+    print(_BANNER)
+
+
+@functools.cache
+def _wizard():
+    """Return the process-wide SetupWizard, created on first use."""
+    from setup.wizard import SetupWizard
+    return SetupWizard()
+
+
+def _print_step(title: str) -> None:
+    """Print a step heading between rules."""
+    rule = "=" * 60
+    print(f"\n{rule}\n{title}\n{rule}")
+
+
+def _print_json(data) -> None:
+    """Print data as indented JSON."""
+    import json
+    print(json.dumps(data, indent=2))
 
 
 def run_setup_keys(args: argparse.Namespace) -> None:
     """Run API key setup."""
+    from setup.api_keys import APIKeyManager
+
     manager = APIKeyManager()
     manager.interactive_setup()
 
 
 def run_interactive(args: argparse.Namespace) -> None:
     """Run interactive configuration setup."""
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
+    from advisor.critical_advisor import CriticalAdvisor
+    from analyzer.config_analyzer import ConfigAnalyzer
+    from generator.config_generator import ConfigGenerator
+    from questions.engine import QuestionEngine
+    from research.researcher import BestPracticesResearcher
+    from review.reviewer import ConfigReviewer
+    from validator.config_validator import ConfigValidator
+
     print_banner()
 
     # Step 0: Ensure setup is complete
     print("🔧 Checking setup...")
-    wizard = SetupWizard()
+    wizard = _wizard()
     profile = wizard.ensure_setup() if not args.quick else wizard.quick_setup()
 
     print(f"\n👋 Welcome back, {profile.name}!")
 
     # Step 1: Analyze existing configs
-    print("\n" + "=" * 60)
-    print("📊 Step 1: LEARNING FROM EXISTING CONFIGURATIONS")
-    print("=" * 60)
+    _print_step("📊 Step 1: LEARNING FROM EXISTING CONFIGURATIONS")
 
     configs_path = Path(args.configs_path) if args.configs_path else None
     if not configs_path and profile.configs_path:
         configs_path = profile.configs_path
 
-    analyzer = ConfigAnalyzer(str(configs_path) if configs_path else str(Path.home() / "claude-configs"))
-    patterns = analyzer.analyze()
+    analyzer = ConfigAnalyzer(str(configs_path or ConfigAnalyzer.DEFAULT_CONFIGS_PATH))
 
-    if patterns.get("configs"):
-        print(f"\n✓ Analyzed {len(patterns.get('configs', []))} existing configurations")
-        print(f"   • {len(patterns.get('agents', []))} agent patterns extracted")
-        print(f"   • {len(patterns.get('commands', []))} command patterns extracted")
-        print(f"   • {len(patterns.get('hooks', []))} hook patterns extracted")
-    else:
-        print("\nℹ No existing configurations found to learn from")
-        print("   That's okay - we'll use best practices from research!")
+    # The analysis is a local disk walk and research waits on the network, so
+    # run the analysis in the background and report it once research is done
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending_patterns = executor.submit(analyzer.analyze)
+    executor.shutdown(wait=False)
+
+    if not args.skip_research:
+        print("\n   Analyzing in the background while research runs...")
 
     # Step 2: Research best practices
-    print("\n" + "=" * 60)
-    print("🔍 Step 2: RESEARCHING BEST PRACTICES")
-    print("=" * 60)
+    _print_step("🔍 Step 2: RESEARCHING BEST PRACTICES")
 
     if args.skip_research:
         print("\n⏭ Skipping research (--skip-research flag)")
@@ -111,16 +132,32 @@ def run_interactive(args: argparse.Namespace) -> None:
         research_results = researcher.research_all(deep=not args.quick)
 
         summary = research_results.get("summary", {})
-        print(f"\n✓ Research complete!")
-        print(f"   • {summary.get('sources_analyzed', 0)} sources analyzed")
-        print(f"   • {summary.get('total_practices', 0)} best practices identified")
-        print(f"   • {summary.get('critical', 0)} critical practices")
-        print(f"   • {summary.get('high', 0)} high-priority practices")
+        print(
+            f"\n✓ Research complete!",
+            f"   • {summary.get('sources_analyzed', 0)} sources analyzed",
+            f"   • {summary.get('total_practices', 0)} best practices identified",
+            f"   • {summary.get('critical', 0)} critical practices",
+            f"   • {summary.get('high', 0)} high-priority practices",
+            sep="\n",
+        )
+
+    patterns = pending_patterns.result()
+
+    configs = patterns.get("configs")
+    if configs:
+        print(
+            f"\n✓ Analyzed {len(configs)} existing configurations",
+            f"   • {len(patterns.get('agents', []))} agent patterns extracted",
+            f"   • {len(patterns.get('commands', []))} command patterns extracted",
+            f"   • {len(patterns.get('hooks', []))} hook patterns extracted",
+            sep="\n",
+        )
+    else:
+        print("\nℹ No existing configurations found to learn from")
+        print("   That's okay - we'll use best practices from research!")
 
     # Step 3: Interactive questionnaire
-    print("\n" + "=" * 60)
-    print("❓ Step 3: CONFIGURATION QUESTIONNAIRE")
-    print("=" * 60)
+    _print_step("❓ Step 3: CONFIGURATION QUESTIONNAIRE")
 
     engine = QuestionEngine(patterns, research_results)
     answers = engine.run_questionnaire()
@@ -130,9 +167,7 @@ def run_interactive(args: argparse.Namespace) -> None:
         return
 
     # Step 4: Critical analysis
-    print("\n" + "=" * 60)
-    print("🤔 Step 4: CRITICAL ANALYSIS")
-    print("=" * 60)
+    _print_step("🤔 Step 4: CRITICAL ANALYSIS")
 
     advisor = CriticalAdvisor(research_results)
     analysis = advisor.analyze_choices(answers)
@@ -146,21 +181,18 @@ def run_interactive(args: argparse.Namespace) -> None:
         return
 
     # Step 5: Generate configuration
-    print("\n" + "=" * 60)
-    print("🔧 Step 5: GENERATING CONFIGURATION")
-    print("=" * 60)
+    _print_step("🔧 Step 5: GENERATING CONFIGURATION")
 
     generator = ConfigGenerator(patterns, research_results)
     config = generator.generate(answers)
 
-    print(f"\n✓ Generated {len(config.get('files', []))} files")
-    for f in config.get("files", []):
+    files = config.get("files", [])
+    print(f"\n✓ Generated {len(files)} files")
+    for f in files:
         print(f"   • {f['path']}")
 
     # Step 6: Validation
-    print("\n" + "=" * 60)
-    print("✅ Step 6: VALIDATION")
-    print("=" * 60)
+    _print_step("✅ Step 6: VALIDATION")
 
     validator = ConfigValidator()
     validation = validator.validate_generated_config(config, generator.files)
@@ -179,22 +211,24 @@ def run_interactive(args: argparse.Namespace) -> None:
 
     # Step 7: Multi-model review (optional)
     if not args.skip_review and profile.api_keys_configured:
-        print("\n" + "=" * 60)
-        print("🔬 Step 7: MULTI-MODEL REVIEW")
-        print("=" * 60)
+        _print_step("🔬 Step 7: MULTI-MODEL REVIEW")
 
         reviewer = ConfigReviewer()
         review_results = reviewer.review(config)
 
         summary = review_results.get("summary", {})
-        print(f"\n✓ Review complete!")
-        print(f"   • {summary.get('total', 0)} issues found")
-        print(f"   • {summary.get('critical', 0)} critical")
-        print(f"   • {summary.get('high', 0)} high")
-
-        if review_results.get("issues"):
+        print(
+            f"\n✓ Review complete!",
+            f"   • {summary.get('total', 0)} issues found",
+            f"   • {summary.get('critical', 0)} critical",
+            f"   • {summary.get('high', 0)} high",
+            sep="\n",
+        )
+
+        issues = review_results.get("issues")
+        if issues:
             print("\nTop findings:")
-            for issue in review_results["issues"][:3]:
+            for issue in issues[:3]:
                 print(f"   [{issue['severity'].upper()}] {issue['message']}")
 
             apply = input("\nApply suggested improvements? [Y/n]: ").strip().lower()
@@ -208,9 +242,7 @@ def run_interactive(args: argparse.Namespace) -> None:
         print("   Run: config-setup --setup-keys to enable multi-model review")
 
     # Step 8: Write configuration
-    print("\n" + "=" * 60)
-    print("💾 Step 8: WRITING CONFIGURATION")
-    print("=" * 60)
+    _print_step("💾 Step 8: WRITING CONFIGURATION")
 
     output_path = Path(args.output) if args.output else Path.cwd() / answers.get("config_name", "new-config")
 
@@ -226,43 +258,47 @@ def run_interactive(args: argparse.Namespace) -> None:
     generator.write_config(config, output_path)
 
     # Final summary
-    print("\n" + "=" * 60)
-    print("🎉 CONFIGURATION COMPLETE!")
-    print("=" * 60)
-
-    print(f"\n✓ Configuration created at: {output_path}")
-    print(f"\nNext steps:")
-    print(f"   1. Review the generated files:")
-    print(f"      ls -la {output_path}")
-    print(f"")
-    print(f"   2. Copy to your project:")
-    print(f"      cp -r {output_path}/.claude your-project/")
-    print(f"      cp {output_path}/CLAUDE.md your-project/")
-    print(f"")
-    print(f"   3. Load your secrets (if using multi-model features):")
-    print(f"      source {answers.get('secrets_location', '~/.secrets/load.sh')}")
-    print(f"")
-    print(f"   4. Start using Claude Code in your project!")
+    _print_step("🎉 CONFIGURATION COMPLETE!")
+
+    print(
+        f"\n✓ Configuration created at: {output_path}",
+        f"\nNext steps:",
+        f"   1. Review the generated files:",
+        f"      ls -la {output_path}",
+        f"",
+        f"   2. Copy to your project:",
+        f"      cp -r {output_path}/.claude your-project/",
+        f"      cp {output_path}/CLAUDE.md your-project/",
+        f"",
+        f"   3. Load your secrets (if using multi-model features):",
+        f"      source {answers.get('secrets_location', '~/.secrets/load.sh')}",
+        f"",
+        f"   4. Start using Claude Code in your project!",
+        sep="\n",
+    )
 
     print("\n" + "=" * 60)
 
 
 def run_analyze(args: argparse.Namespace) -> None:
     """Analyze existing configurations."""
+    from analyzer.config_analyzer import ConfigAnalyzer
+
     print("📊 Analyzing configurations...\n")
 
-    analyzer = ConfigAnalyzer(args.path or str(Path.home() / "claude-configs"))
+    analyzer = ConfigAnalyzer(args.path or str(ConfigAnalyzer.DEFAULT_CONFIGS_PATH))
     patterns = analyzer.analyze()
 
     if args.json:
-        import json
-        print(json.dumps(patterns, indent=2))
+        _print_json(patterns)
     else:
         analyzer.print_summary(patterns)
 
 
 def run_research(args: argparse.Namespace) -> None:
     """Research Claude Code best practices."""
+    from research.researcher import BestPracticesResearcher, ResearchContext
+
     print("🔍 Researching best practices...\n")
 
     context = ResearchContext()
@@ -277,14 +313,18 @@ def run_research(args: argparse.Namespace) -> None:
         results = researcher.research_all(deep=not args.quick)
 
     if args.json:
-        import json
-        print(json.dumps(results, indent=2))
+        _print_json(results)
     else:
         researcher.print_summary(results)
 
 
 def run_review(args: argparse.Namespace) -> None:
     """Review an existing configuration."""
+    from pathlib import Path
+
+    from review.reviewer import ConfigReviewer
+    from validator.config_validator import ConfigValidator
+
     print("🔬 Reviewing configuration...\n")
 
     config_path = Path(args.config_path).expanduser()
@@ -298,7 +338,7 @@ def run_review(args: argparse.Namespace) -> None:
     validator.print_report(validation)
 
     # Then review with models if keys available
-    wizard = SetupWizard()
+    wizard = _wizard()
     wizard.api_key_manager.load_env_file()
 
     if wizard.api_key_manager.get_key("openai") or wizard.api_key_manager.get_key("gemini"):
@@ -307,8 +347,7 @@ def run_review(args: argparse.Namespace) -> None:
         results = reviewer.review_path(config_path)
 
         if args.json:
-            import json
-            print(json.dumps(results, indent=2))
+            _print_json(results)
         else:
             reviewer.print_results(results)
     else:
@@ -318,6 +357,10 @@ def run_review(args: argparse.Namespace) -> None:
 
 def run_validate(args: argparse.Namespace) -> None:
     """Validate an existing configuration."""
+    from pathlib import Path
+
+    from validator.config_validator import ConfigValidator
+
     print("✅ Validating configuration...\n")
 
     config_path = Path(args.config_path).expanduser()
@@ -329,8 +372,7 @@ def run_validate(args: argparse.Namespace) -> None:
     report = validator.validate_path(config_path)
 
     if args.json:
-        import json
-        print(json.dumps({
+        _print_json({
             "is_valid": report.is_valid,
             "score": report.score,
             "summary": report.summary,
@@ -338,7 +380,7 @@ def run_validate(args: argparse.Namespace) -> None:
                 {"severity": i.severity, "file": i.file, "message": i.message}
                 for i in report.issues
             ]
-        }, indent=2))
+        })
     else:
         validator.print_report(report)
 
@@ -347,7 +389,7 @@ def run_status(args: argparse.Namespace) -> None:
     """Show current setup status."""
     print("📊 Configuration Setup Status\n")
 
-    wizard = SetupWizard()
+    wizard = _wizard()
 
     # API Keys
     print("🔑 API Keys:")
@@ -365,13 +407,16 @@ def run_status(args: argparse.Namespace) -> None:
     if profile:
         print(f"   Name: {profile.name}")
         print(f"   Discovered configs: {len(profile.discovered_configs)}")
-        print(f"   Default autonomy: {profile.preferences.get('default_autonomy', 'not set')}")
-        print(f"   Default security: {profile.preferences.get('default_security', 'not set')}")
+        preferences = profile.preferences
+        print(f"   Default autonomy: {preferences.get('default_autonomy', 'not set')}")
+        print(f"   Default security: {preferences.get('default_security', 'not set')}")
     else:
         print("   Not configured. Run: config-setup")
 
 
-def main():
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Claude Code Config Setup Pipeline - Generate exceptional configurations",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -443,9 +488,23 @@ Examples:
     validate_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     # Status subcommand
-    status_parser = subparsers.add_parser("status", help="Show setup status")
+    subparsers.add_parser("status", help="Show setup status")
+
+    return parser
+
+
+def main():
+    # Lone --version / --setup-keys take no other arguments, so answer them
+    # without building the full parser
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        print(f"{os.path.basename(sys.argv[0])} {VERSION}")
+        return
+    if argv == ["--setup-keys"]:
+        run_setup_keys(argparse.Namespace(setup_keys=True))
+        return
 
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
 
     # Handle --setup-keys flag
     if args.setup_keys:
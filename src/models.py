@@ -7,8 +7,12 @@ Uses Pydantic for validation and serialization.
 
 from enum import Enum
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Union
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
+
+# Build validators/serializers on first use rather than at import time, so
+# commands that only need the enums don't pay for schema construction.
+_DEFERRED = ConfigDict(defer_build=True)
 
 
 # =============================================================================
@@ -83,6 +87,8 @@ class Priority(str, Enum):
 
 class TechStack(BaseModel):
     """Technology stack configuration."""
+    model_config = _DEFERRED
+
     primary_language: str = Field(description="Primary programming language")
     frameworks: list[str] = Field(default_factory=list, description="Frameworks in use")
     package_manager: str = Field(default="", description="Package manager (npm, pip, etc.)")
@@ -93,6 +99,8 @@ class TechStack(BaseModel):
 
 class QuestionnaireAnswers(BaseModel):
     """Strongly-typed questionnaire answers."""
+    model_config = _DEFERRED
+
     # Basic info
     config_name: str = Field(description="Configuration name")
     identity_phrase: str = Field(default="", description="Identity confirmation phrase")
@@ -127,6 +135,8 @@ class QuestionnaireAnswers(BaseModel):
 
 class UserProfile(BaseModel):
     """User profile from setup wizard."""
+    model_config = _DEFERRED
+
     name: str = Field(description="User's name")
     configs_path: Optional[Path] = Field(default=None, description="Path to existing configs")
     discovered_configs: list[str] = Field(default_factory=list)
@@ -136,6 +146,8 @@ class UserProfile(BaseModel):
 
 class ResearchResults(BaseModel):
     """Results from best practices research."""
+    model_config = _DEFERRED
+
     sources_analyzed: int = Field(default=0)
     practices: list[dict] = Field(default_factory=list)
     summary: dict = Field(default_factory=dict)
@@ -143,6 +155,8 @@ class ResearchResults(BaseModel):
 
 class AnalysisPatterns(BaseModel):
     """Patterns extracted from existing configs."""
+    model_config = _DEFERRED
+
     configs: list[str] = Field(default_factory=list)
     agents: list[dict] = Field(default_factory=list)
     commands: list[dict] = Field(default_factory=list)
@@ -152,6 +166,8 @@ class AnalysisPatterns(BaseModel):
 
 class ValidationIssue(BaseModel):
     """A validation issue."""
+    model_config = _DEFERRED
+
     severity: Severity
     file: str
     line: Optional[int] = None
@@ -161,6 +177,8 @@ class ValidationIssue(BaseModel):
 
 class ValidationReport(BaseModel):
     """Complete validation report."""
+    model_config = _DEFERRED
+
     is_valid: bool
     issues: list[ValidationIssue] = Field(default_factory=list)
     score: int = Field(ge=0, le=100)
@@ -171,6 +189,8 @@ class ValidationReport(BaseModel):
 
 class Concern(BaseModel):
     """A concern from critical advisor."""
+    model_config = _DEFERRED
+
     severity: Severity
     category: Category
     message: str
@@ -181,6 +201,8 @@ class Concern(BaseModel):
 
 class AnalysisResult(BaseModel):
     """Result of critical analysis."""
+    model_config = _DEFERRED
+
     is_valid: bool
     concerns: list[Concern] = Field(default_factory=list)
     score: int = Field(ge=0, le=100)
@@ -189,6 +211,8 @@ class AnalysisResult(BaseModel):
 
 class GeneratedFile(BaseModel):
     """A generated configuration file."""
+    model_config = _DEFERRED
+
     path: str
     content: str
     description: str = ""
@@ -196,6 +220,8 @@ class GeneratedFile(BaseModel):
 
 class ReviewIssue(BaseModel):
     """An issue from multi-model review."""
+    model_config = _DEFERRED
+
     severity: Severity
     category: Category
     message: str
@@ -226,5 +252,50 @@ class PipelineContext(BaseModel):
     # State
     current_stage: str = ""
     completed_stages: list[str] = Field(default_factory=list)
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    stage_durations: dict[str, int] = Field(default_factory=dict)  # stage name -> wall time (ns)
+
+    # field name -> model_dump() of its current value
+    _dumps: dict = PrivateAttr(default_factory=dict)
+    # completed_stages as a set, for O(1) is_completed()
+    _completed: set = PrivateAttr(default_factory=set)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
+
+    def model_post_init(self, __context) -> None:
+        self._completed = set(self.completed_stages)
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._dumps.pop(name, None)
+            if name == "completed_stages":
+                self._completed = set(value)
+
+    def mark_completed(self, stage_name: str) -> None:
+        """Record that a stage finished."""
+        self.completed_stages.append(stage_name)
+        self._completed.add(stage_name)
+
+    def is_completed(self, stage_name: str) -> bool:
+        """Check whether a stage has finished."""
+        return stage_name in self._completed
+
+    def dump(self, name: str) -> Union[dict, list]:
+        """
+        Return ``model_dump()`` of a sub-model field, or {} when it is unset.
+
+        List fields (e.g. ``generated_files``) dump to a list of dicts. The
+        result is cached until the field is reassigned, so stages share one
+        dump instead of each re-serializing the same models. Treat it as
+        read-only, and reassign list fields rather than mutating them.
+        """
+        try:
+            return self._dumps[name]
+        except KeyError:
+            value = getattr(self, name)
+            if isinstance(value, list):
+                dumped = [item.model_dump() for item in value]
+            else:
+                dumped = value.model_dump() if value is not None else {}
+            self._dumps[name] = dumped
+            return dumped
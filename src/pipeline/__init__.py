@@ -10,6 +10,7 @@ from .stages import (
     GenerationStage,
     ValidationStage,
     ReviewStage,
+    build_default_pipeline,
 )
 
 __all__ = [
@@ -23,4 +24,5 @@ __all__ = [
     "GenerationStage",
     "ValidationStage",
     "ReviewStage",
+    "build_default_pipeline",
 ]
@@ -9,13 +9,18 @@ Implements the Pipeline + Stage pattern for:
 - Plugin extensibility
 """
 
+import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, Callable
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .._common import atomic_write
 from ..models import PipelineContext
 
 logger = logging.getLogger(__name__)
@@ -31,10 +36,17 @@ class PipelineStage(ABC):
     - Performs its operation
     - Returns the modified context
     - Can be skipped or run in isolation
+
+    Stages listed in ``depends_on`` must finish before this one starts;
+    stages whose dependencies are met together run concurrently and share
+    the context, so they must write disjoint fields. ``None`` makes the stage
+    a barrier: it runs after every earlier stage and every later stage waits
+    for it, which keeps plain lists and inserted plugins sequential.
     """
     
     name: str = "unnamed"
     description: str = ""
+    depends_on: Optional[tuple[str, ...]] = None
     
     @abstractmethod
     def run(self, context: PipelineContext) -> PipelineContext:
@@ -68,28 +80,82 @@ class Pipeline:
     Orchestrates the execution of pipeline stages.
     
     Features:
-    - Sequential stage execution
+    - Dependency-ordered execution (independent stages run concurrently)
     - Progress tracking
     - Error handling and recovery
     - Resume from checkpoint
     - Dry-run mode
+
+    With a checkpoint file, the context is saved after every completed wave
+    of stages and removed once the pipeline finishes, so ``run(resume=True)``
+    can pick up an interrupted run without repeating finished stages. The
+    checkpoint is stored with ``checkpoint_key``, which identifies the run's
+    inputs; a checkpoint taken with a different key is ignored.
     """
+
+    CHECKPOINT_FILE = Path.home() / ".cache" / "config-setup-pipeline" / "pipeline_checkpoint.json"
     
     def __init__(
         self,
         stages: list[PipelineStage],
-        on_progress: Optional[Callable[[str, int, int], None]] = None
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+        checkpoint_file: Optional[Path] = None,
+        checkpoint_key: str = ""
     ):
         self.stages = stages
         self.on_progress = on_progress
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_key = checkpoint_key
         self._current_stage_idx = 0
+        # Stage name -> index of its first occurrence
+        self._by_name: dict[str, int] = {}
+        for i, stage in enumerate(stages):
+            self._by_name.setdefault(stage.name, i)
+        self._waves = self._plan_waves(stages, self._by_name)
+
+    @staticmethod
+    def _plan_waves(stages: list[PipelineStage], index: dict[str, int]) -> list[list[int]]:
+        """
+        Group stage indices into waves (Kahn's algorithm).
+
+        Every stage in a wave depends only on stages in earlier waves, and
+        stages within a wave keep their list order. Dependencies on stages
+        that are not part of this pipeline are ignored. A stage without
+        ``depends_on`` waits for all earlier stages, and all later stages
+        wait for it.
+        """
+        deps = []
+        barrier = None
+        for i, stage in enumerate(stages):
+            if stage.depends_on is None:
+                deps.append(set(range(i)))
+                barrier = i
+            else:
+                stage_deps = {index[name] for name in stage.depends_on if name in index}
+                if barrier is not None:
+                    stage_deps.add(barrier)
+                deps.append(stage_deps)
+
+        waves = []
+        done: set[int] = set()
+        remaining = list(range(len(stages)))
+        while remaining:
+            ready = [i for i in remaining if deps[i] <= done]
+            if not ready:
+                names = ", ".join(stages[i].name for i in remaining)
+                raise ValueError(f"Stage dependencies form a cycle: {names}")
+            waves.append(ready)
+            done.update(ready)
+            remaining = [i for i in remaining if i not in done]
+        return waves
     
     def run(
         self,
         context: Optional[PipelineContext] = None,
         dry_run: bool = False,
         start_from: Optional[str] = None,
-        stop_after: Optional[str] = None
+        stop_after: Optional[str] = None,
+        resume: bool = False
     ) -> PipelineContext:
         """
         Run the complete pipeline.
@@ -99,20 +165,27 @@ class Pipeline:
             dry_run: If True, only validate without executing
             start_from: Stage name to start from (for resume)
             stop_after: Stage name to stop after
+            resume: If True and no context is given, continue from the saved
+                checkpoint, skipping the stages it already completed
             
         Returns:
             Final pipeline context
         """
+        resuming = False
+        if context is None and resume:
+            context = self._load_checkpoint()
+            if context is not None:
+                resuming = True
+                logger.info(f"Resuming after stages: {', '.join(context.completed_stages)}")
         if context is None:
             context = PipelineContext()
         
         # Find start index
-        start_idx = 0
-        if start_from:
-            for i, stage in enumerate(self.stages):
-                if stage.name == start_from:
-                    start_idx = i
-                    break
+        start_idx = self._by_name.get(start_from, 0) if start_from else 0
+
+        # Nothing executes in a dry run, so skip the progress display entirely
+        if dry_run:
+            return self._run_dry(context, start_idx, resuming)
         
         total_stages = len(self.stages)
         
@@ -124,60 +197,160 @@ class Pipeline:
         ) as progress:
             task = progress.add_task("Running pipeline...", total=total_stages)
             
-            for idx, stage in enumerate(self.stages[start_idx:], start=start_idx):
-                self._current_stage_idx = idx
-                context.current_stage = stage.name
+            for wave in self._pending_waves(context, start_idx, resuming):
+                runnable = []
+                for idx in wave:
+                    stage = self.stages[idx]
+                    self._current_stage_idx = idx
+                    context.current_stage = stage.name
+                    
+                    # Update progress
+                    progress.update(task, description=f"[cyan]{stage.description}[/]")
+                    
+                    if self.on_progress:
+                        self.on_progress(stage.name, idx + 1, total_stages)
+                    
+                    # Skip check
+                    if stage.should_skip(context):
+                        logger.info(f"Skipping stage: {stage.name}")
+                        progress.advance(task)
+                        continue
+                    
+                    # Validate inputs
+                    if not stage.validate_input(context):
+                        logger.warning(f"Stage {stage.name} missing required inputs")
+                        raise ValueError(f"Stage {stage.name} cannot run - missing inputs")
+                    
+                    runnable.append(stage)
                 
-                # Update progress
-                progress.update(task, description=f"[cyan]{stage.description}[/]")
+                # Execute stages
+                context = self._run_wave(runnable, context)
+                progress.advance(task, len(runnable))
+                if runnable:
+                    self._save_checkpoint(context)
                 
+                # Stop after check
+                if stop_after and any(stage.name == stop_after for stage in runnable):
+                    logger.info(f"Stopping after stage: {stop_after}")
+                    break
+            else:
+                self._clear_checkpoint()
+        
+        return context
+
+    def _pending_waves(self, context: PipelineContext, start_idx: int, resuming: bool):
+        """Yield each wave's stage indices, minus those before start_idx or already resumed."""
+        for wave in self._waves:
+            yield [
+                idx for idx in wave
+                if idx >= start_idx
+                and not (resuming and context.is_completed(self.stages[idx].name))
+            ]
+
+    def _run_dry(self, context: PipelineContext, start_idx: int, resuming: bool) -> PipelineContext:
+        """Report what each stage would do without executing anything."""
+        total_stages = len(self.stages)
+        for wave in self._pending_waves(context, start_idx, resuming):
+            for idx in wave:
+                stage = self.stages[idx]
+                self._current_stage_idx = idx
+                context.current_stage = stage.name
+
                 if self.on_progress:
                     self.on_progress(stage.name, idx + 1, total_stages)
-                
-                # Skip check
+
                 if stage.should_skip(context):
                     logger.info(f"Skipping stage: {stage.name}")
-                    progress.advance(task)
-                    continue
-                
-                # Validate inputs
-                if not stage.validate_input(context):
+                elif not stage.validate_input(context):
                     logger.warning(f"Stage {stage.name} missing required inputs")
-                    if not dry_run:
-                        raise ValueError(f"Stage {stage.name} cannot run - missing inputs")
-                    progress.advance(task)
-                    continue
-                
-                # Dry run mode
-                if dry_run:
+                else:
                     logger.info(f"[DRY RUN] Would execute: {stage.name}")
-                    progress.advance(task)
-                    continue
-                
-                # Execute stage
+        return context
+
+    def _load_checkpoint(self) -> Optional[PipelineContext]:
+        """Load the saved context; a missing, unreadable or mismatched checkpoint is ignored."""
+        if self.checkpoint_file is None:
+            return None
+        try:
+            checkpoint = json.loads(self.checkpoint_file.read_bytes())
+            if checkpoint.get("key") != self.checkpoint_key:
+                logger.warning(
+                    f"Ignoring checkpoint {self.checkpoint_file}: it was taken with different inputs"
+                )
+                return None
+            return PipelineContext.model_validate(checkpoint["context"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_file}: {e}")
+            return None
+
+    def _save_checkpoint(self, context: PipelineContext) -> None:
+        """Atomically persist the context after a completed wave."""
+        if self.checkpoint_file is None:
+            return
+        checkpoint = {"key": self.checkpoint_key, "context": context.model_dump(mode="json")}
+        if not atomic_write(self.checkpoint_file, json.dumps(checkpoint).encode("utf-8")):
+            # Checkpointing only enables resume; the run itself is unaffected
+            logger.warning(f"Could not save checkpoint {self.checkpoint_file}")
+
+    def _clear_checkpoint(self) -> None:
+        """Remove the checkpoint once the pipeline has run to completion."""
+        if self.checkpoint_file is None:
+            return
+        try:
+            self.checkpoint_file.unlink()
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _timed_run(stage: PipelineStage, context: PipelineContext) -> PipelineContext:
+        """Run a stage and record its wall time (ns) in context.stage_durations."""
+        start = time.perf_counter_ns()
+        context = stage.run(context)
+        elapsed = time.perf_counter_ns() - start
+        context.stage_durations[stage.name] = elapsed
+        logger.debug(f"Stage {stage.name} took {elapsed / 1e6:.1f} ms")
+        return context
+
+    def _run_wave(self, stages: list[PipelineStage], context: PipelineContext) -> PipelineContext:
+        """Run mutually independent stages, concurrently when there are several."""
+        if len(stages) <= 1:
+            for stage in stages:
                 try:
-                    context = stage.run(context)
-                    context.completed_stages.append(stage.name)
+                    context = self._timed_run(stage, context)
+                    context.mark_completed(stage.name)
                 except Exception as e:
                     logger.error(f"Stage {stage.name} failed: {e}")
                     context = stage.on_error(context, e)
                     raise
-                
-                progress.advance(task)
-                
-                # Stop after check
-                if stop_after and stage.name == stop_after:
-                    logger.info(f"Stopping after stage: {stage.name}")
-                    break
-        
+            return context
+
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [executor.submit(self._timed_run, stage, context) for stage in stages]
+
+        # Record results in list order; re-raise the first failure once every
+        # stage in the wave has finished
+        error = None
+        for stage, future in zip(stages, futures):
+            try:
+                context = future.result()
+                context.mark_completed(stage.name)
+            except Exception as e:
+                logger.error(f"Stage {stage.name} failed: {e}")
+                context = stage.on_error(context, e)
+                error = error or e
+        if error is not None:
+            raise error
         return context
     
     def run_stage(self, stage_name: str, context: PipelineContext) -> PipelineContext:
         """Run a single stage by name."""
-        for stage in self.stages:
-            if stage.name == stage_name:
-                return stage.run(context)
-        raise ValueError(f"Stage not found: {stage_name}")
+        try:
+            idx = self._by_name[stage_name]
+        except KeyError:
+            raise ValueError(f"Stage not found: {stage_name}") from None
+        return self.stages[idx].run(context)
     
     def get_stage_names(self) -> list[str]:
         """Get list of all stage names."""
@@ -8,14 +8,21 @@ Each stage is a self-contained unit that:
 - Can be skipped or run standalone
 """
 
+import functools
+import hashlib
 import logging
+import os
+import re
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
 from rich.prompt import Confirm
 
-from .base import PipelineStage
+from .base import Pipeline, PipelineStage
+from .._common import atomic_write
 from ..models import (
     PipelineContext,
     UserProfile,
@@ -25,17 +32,144 @@ from ..models import (
     AnalysisResult,
     ValidationReport,
     GeneratedFile,
+    Purpose,
+    AutonomyLevel,
+    SecurityLevel,
+    Severity,
+    Category,
+    Concern,
+    ValidationIssue as ModelValidationIssue,
+    ReviewIssue as ModelReviewIssue,
 )
 
+# Optional fast JSON parser for answers files; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Stages in the same wave run concurrently; hold this while printing a
+# multi-line summary, or while calling into a component that prints its own
+# progress, so the lines from different stages don't interleave
+_output_lock = threading.Lock()
+
+# Characters not allowed in a config directory name
+_UNSAFE_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Exact value -> member for the enums answers are matched against
+_ENUM_VALUES = {
+    enum_class: {member.value: member for member in enum_class}
+    for enum_class in (Purpose, AutonomyLevel, SecurityLevel)
+}
+# Lowercased (value, member) pairs for partial matching, in definition order
+_ENUM_PARTIALS = {
+    enum_class: tuple((value.lower(), member) for value, member in values.items())
+    for enum_class, values in _ENUM_VALUES.items()
+}
+
+# Lowercased severity/category strings from each tool -> model enums
+_ANALYSIS_SEVERITY = {"critical": Severity.CRITICAL, "warning": Severity.WARNING, "suggestion": Severity.SUGGESTION}
+_ANALYSIS_CATEGORY = {"security": Category.SECURITY, "workflow": Category.WORKFLOW,
+                      "features": Category.FEATURES, "tech_stack": Category.TECH_STACK,
+                      "essentials": Category.ESSENTIALS}
+_VALIDATION_SEVERITY = {"error": Severity.CRITICAL, "warning": Severity.WARNING, "info": Severity.INFO}
+_REVIEW_SEVERITY = {"critical": Severity.CRITICAL, "high": Severity.HIGH,
+                    "medium": Severity.MEDIUM, "low": Severity.LOW}
+_REVIEW_CATEGORY = {"security": Category.SECURITY, "best_practice": Category.BEST_PRACTICE,
+                    "missing": Category.MISSING, "improvement": Category.IMPROVEMENT}
+
+
+@functools.cache
+def _review_issues_adapter():
+    """TypeAdapter for list[ReviewIssue], built on first use like the models."""
+    from pydantic import TypeAdapter
+    return TypeAdapter(list[ModelReviewIssue])
+
+
+def _safe_str(value, default: str = "") -> str:
+    """Safely convert value to string, return default if not a string."""
+    return value if isinstance(value, str) else default
+
+
+def _match_enum(value, enum_class, default):
+    """Find enum by exact value, then by case-insensitive partial match, or return default."""
+    str_value = _safe_str(value)
+    if not str_value:
+        return default
+    member = _ENUM_VALUES[enum_class].get(str_value)
+    if member is not None:
+        return member
+    str_value = str_value.lower()
+    for member_value, member in _ENUM_PARTIALS[enum_class]:
+        if str_value in member_value or member_value in str_value:
+            return member
+    return default
+
+
+# Parsed YAML answers files, kept as JSON so later runs skip the YAML parser
+_ANSWERS_CACHE_DIR = Path.home() / ".cache" / "config-setup-pipeline" / "answers"
+
+
+def _parse_json(data: bytes):
+    """Parse JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_answers(path: Path, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a JSON or YAML answers file.
+
+    Keyed on the file's mtime and size, so an edited file is parsed again.
+    The returned dict is shared between callers and must not be modified.
+    """
+    if path.suffix not in ('.yaml', '.yml'):
+        return _parse_json(path.read_bytes())
+
+    cache_file = _ANSWERS_CACHE_DIR / f"{hashlib.sha256(str(path).encode('utf-8')).hexdigest()[:16]}.json"
+    try:
+        cached = _parse_json(cache_file.read_bytes())
+        if cached["mtime_ns"] == mtime_ns and cached["size"] == size:
+            return cached["answers"]
+    except Exception:
+        pass
+
+    try:
+        import yaml
+    except ImportError:
+        console.print("[red]YAML support requires pyyaml: pip install pyyaml[/]")
+        raise ValueError("pyyaml not installed")
+    # libyaml's C loader is much faster when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    answers = yaml.load(path.read_bytes(), Loader=loader)
+    _save_answers_cache(cache_file, {"mtime_ns": mtime_ns, "size": size, "answers": answers})
+    return answers
+
+
+def _save_answers_cache(cache_file: Path, entry: dict) -> None:
+    """Atomically persist parsed answers, if they survive a JSON round-trip."""
+    import json
+    try:
+        data = json.dumps(entry)
+    except (TypeError, ValueError):
+        return
+    # YAML can hold dates and non-string keys that JSON would change
+    if json.loads(data) == entry:
+        atomic_write(cache_file, data.encode("utf-8"))
+
 
 class SetupStage(PipelineStage):
     """First-time setup and profile loading."""
     
     name = "setup"
     description = "Setting up environment"
+    depends_on = ()
     
     def __init__(self, quick_mode: bool = False):
         self.quick_mode = quick_mode
@@ -53,7 +187,8 @@ class SetupStage(PipelineStage):
         # Convert wizard's list[str] to bool for Pydantic model
         has_api_keys = len(profile.api_keys_configured) > 0 if isinstance(profile.api_keys_configured, list) else bool(profile.api_keys_configured)
 
-        context.profile = UserProfile(
+        # Built from the wizard's own profile, so skip re-validation
+        context.profile = UserProfile.model_construct(
             name=profile.name,
             configs_path=profile.configs_path,
             discovered_configs=profile.discovered_configs,
@@ -70,6 +205,7 @@ class ConfigDiscoveryStage(PipelineStage):
     
     name = "discovery"
     description = "Analyzing existing configurations"
+    depends_on = ("setup",)
     
     def __init__(self, configs_path: Optional[Path] = None):
         self.configs_path = configs_path
@@ -82,12 +218,13 @@ class ConfigDiscoveryStage(PipelineStage):
         if not path and context.profile and context.profile.configs_path:
             path = context.profile.configs_path
         if not path:
-            path = Path.home() / "claude-configs"
+            path = ConfigAnalyzer.DEFAULT_CONFIGS_PATH
         
         analyzer = ConfigAnalyzer(str(path))
         patterns = analyzer.analyze()
         
-        context.patterns = AnalysisPatterns(
+        # Analyzer output is already well-typed; skip re-validation
+        context.patterns = AnalysisPatterns.model_construct(
             configs=patterns.get("configs", []),
             agents=patterns.get("agents", []),
             commands=patterns.get("commands", []),
@@ -95,12 +232,13 @@ class ConfigDiscoveryStage(PipelineStage):
             permissions=patterns.get("permissions", [])
         )
         
-        if patterns.get("configs"):
-            console.print(f"\n[green]Analyzed {len(patterns['configs'])} existing configs[/]")
-            console.print(f"  • {len(patterns.get('agents', []))} agent patterns")
-            console.print(f"  • {len(patterns.get('commands', []))} command patterns")
-        else:
-            console.print("\n[yellow]No existing configs found - using best practices[/]")
+        with _output_lock:
+            if patterns.get("configs"):
+                console.print(f"\n[green]Analyzed {len(patterns['configs'])} existing configs[/]")
+                console.print(f"  • {len(patterns.get('agents', []))} agent patterns")
+                console.print(f"  • {len(patterns.get('commands', []))} command patterns")
+            else:
+                console.print("\n[yellow]No existing configs found - using best practices[/]")
         
         return context
 
@@ -110,10 +248,16 @@ class ResearchStage(PipelineStage):
     
     name = "research"
     description = "Researching best practices"
+    depends_on = ("setup",)
+
+    CACHE_DIR = Path.home() / ".cache" / "config-setup-pipeline" / "research"
+    # Sources are live web pages, so cached results expire after a day
+    CACHE_TTL_SECONDS = 24 * 60 * 60
     
-    def __init__(self, deep: bool = True, skip: bool = False):
+    def __init__(self, deep: bool = True, skip: bool = False, use_cache: bool = True):
         self.deep = deep
         self._skip = skip
+        self.use_cache = use_cache
     
     def should_skip(self, context: PipelineContext) -> bool:
         return self._skip
@@ -122,56 +266,83 @@ class ResearchStage(PipelineStage):
         from ..research.researcher import BestPracticesResearcher
         
         researcher = BestPracticesResearcher()
-        results = researcher.research_all(deep=self.deep)
+        cache_file = self._cache_file(researcher) if self.use_cache else None
+        research = self._load_cached(cache_file)
+        cached = research is not None
+        if not cached:
+            with _output_lock:
+                results = researcher.research_all(deep=self.deep)
+            
+            summary = results.get("summary", {})
+            # Researcher output is already well-typed; skip re-validation
+            research = ResearchResults.model_construct(
+                sources_analyzed=summary.get("sources_analyzed", 0),
+                practices=results.get("practices", []),
+                summary=summary
+            )
+            self._save_cached(cache_file, research)
         
-        summary = results.get("summary", {})
-        context.research = ResearchResults(
-            sources_analyzed=summary.get("sources_analyzed", 0),
-            practices=results.get("practices", []),
-            summary=summary
-        )
+        context.research = research
+        summary = research.summary
         
-        console.print(f"\n[green]Research complete![/]")
-        console.print(f"  • {summary.get('sources_analyzed', 0)} sources analyzed")
-        console.print(f"  • {summary.get('total_practices', 0)} best practices found")
+        with _output_lock:
+            if cached:
+                console.print("\n[dim]Using cached research results[/]")
+            console.print(f"\n[green]Research complete![/]")
+            console.print(f"  • {summary.get('sources_analyzed', 0)} sources analyzed")
+            console.print(f"  • {summary.get('total_practices', 0)} best practices found")
         
         return context
 
+    def _cache_file(self, researcher) -> Path:
+        """Cache file for this research configuration (mode and source list)."""
+        # LLM synthesis only runs in deep mode with an API key available
+        use_llm = self.deep and bool(researcher.openai_key or researcher.gemini_key)
+        key = "\n".join([str(self.deep), str(use_llm), *(s["url"] for s in researcher.OFFICIAL_SOURCES)])
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return self.CACHE_DIR / f"{digest}.json"
+
+    def _load_cached(self, cache_file: Optional[Path]) -> Optional[ResearchResults]:
+        """Load fresh cached results; missing, expired or corrupt entries return None."""
+        if cache_file is None:
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.CACHE_TTL_SECONDS:
+                return None
+            return ResearchResults.model_validate_json(cache_file.read_bytes())
+        except Exception:
+            return None
+
+    def _save_cached(self, cache_file: Optional[Path], research: ResearchResults) -> None:
+        """Atomically persist results for later runs."""
+        if cache_file is not None:
+            atomic_write(cache_file, research.model_dump_json().encode("utf-8"))
+
 
 class QuestionnaireStage(PipelineStage):
     """Interactive questionnaire for configuration preferences."""
     
     name = "questionnaire"
     description = "Configuration questionnaire"
+    depends_on = ("discovery", "research")
     
     def __init__(self, answers_file: Optional[Path] = None):
         self.answers_file = answers_file
     
     def run(self, context: PipelineContext) -> PipelineContext:
         from ..questions.engine import QuestionEngine
-        from ..models import Purpose, AutonomyLevel, SecurityLevel
 
         # If answers file provided, load from it (non-interactive mode)
         if self.answers_file and self.answers_file.exists():
-            file_content = self.answers_file.read_text()
-
             # Support both JSON and YAML
-            if self.answers_file.suffix in ['.yaml', '.yml']:
-                try:
-                    import yaml
-                    answers_dict = yaml.safe_load(file_content)
-                except ImportError:
-                    console.print("[red]YAML support requires pyyaml: pip install pyyaml[/]")
-                    raise ValueError("pyyaml not installed")
-            else:
-                import json
-                answers_dict = json.loads(file_content)
+            st = self.answers_file.stat()
+            answers_dict = _load_answers(self.answers_file, st.st_mtime_ns, st.st_size)
 
             console.print(f"[cyan]Loaded answers from {self.answers_file}[/]")
         else:
             # Interactive mode
-            patterns = context.patterns.model_dump() if context.patterns else {}
-            research = context.research.model_dump() if context.research else {}
+            patterns = context.dump("patterns")
+            research = context.dump("research")
 
             engine = QuestionEngine(patterns, research)
             answers_dict = engine.run_questionnaire()
@@ -180,38 +351,24 @@ class QuestionnaireStage(PipelineStage):
                 raise ValueError("Questionnaire cancelled by user")
 
         # Map string values to enums with fallbacks
-        def safe_str(value, default: str = "") -> str:
-            """Safely convert value to string, return default if not a string."""
-            return value if isinstance(value, str) else default
-
-        def match_enum(value, enum_class, default):
-            """Find enum by partial match or return default."""
-            str_value = safe_str(value, "")
-            if not str_value:
-                return default
-            for member in enum_class:
-                if str_value in member.value or member.value in str_value:
-                    return member
-            return default
-
-        purpose = match_enum(
+        purpose = _match_enum(
             answers_dict.get("purpose"),
             Purpose,
             Purpose.SOLO
         )
-        autonomy = match_enum(
+        autonomy = _match_enum(
             answers_dict.get("autonomy_level"),
             AutonomyLevel,
             AutonomyLevel.SENIOR_DEV
         )
-        security = match_enum(
+        security = _match_enum(
             answers_dict.get("security_level"),
             SecurityLevel,
             SecurityLevel.STANDARD
         )
 
         # Safely extract and validate values from answers_dict
-        config_name = safe_str(answers_dict.get("config_name"), "new-config")
+        config_name = _safe_str(answers_dict.get("config_name"), "new-config")
         enable_memory = bool(answers_dict.get("enable_memory", False))
         enable_multi_model = bool(answers_dict.get("enable_multi_model", False))
 
@@ -236,32 +393,23 @@ class CriticalAnalysisStage(PipelineStage):
 
     name = "analysis"
     description = "Analyzing configuration choices"
+    depends_on = ("questionnaire",)
 
     def run(self, context: PipelineContext) -> PipelineContext:
         from ..advisor.critical_advisor import CriticalAdvisor
-        from ..models import Concern, Severity, Category
 
-        research = context.research.model_dump() if context.research else {}
-        answers = context.answers.model_dump() if context.answers else {}
+        research = context.dump("research")
+        answers = context.dump("answers")
 
         advisor = CriticalAdvisor(research)
         analysis = advisor.analyze_choices(answers)
 
-        # Convert dataclass concerns to Pydantic models
-        def convert_severity(s: str) -> Severity:
-            mapping = {"critical": Severity.CRITICAL, "warning": Severity.WARNING, "suggestion": Severity.SUGGESTION}
-            return mapping.get(s.lower(), Severity.MEDIUM)
-
-        def convert_category(c: str) -> Category:
-            mapping = {"security": Category.SECURITY, "workflow": Category.WORKFLOW,
-                       "features": Category.FEATURES, "tech_stack": Category.TECH_STACK,
-                       "essentials": Category.ESSENTIALS}
-            return mapping.get(c.lower(), Category.IMPROVEMENT)
-
+        # Convert dataclass concerns to Pydantic models (trusted advisor
+        # output, so skip re-validation)
         converted_concerns = [
-            Concern(
-                severity=convert_severity(c.severity),
-                category=convert_category(c.category),
+            Concern.model_construct(
+                severity=_ANALYSIS_SEVERITY.get(c.severity.lower(), Severity.MEDIUM),
+                category=_ANALYSIS_CATEGORY.get(c.category.lower(), Category.IMPROVEMENT),
                 message=c.message,
                 question=c.question,
                 recommendation=c.recommendation,
@@ -270,7 +418,7 @@ class CriticalAnalysisStage(PipelineStage):
             for c in analysis.concerns
         ]
 
-        context.analysis = AnalysisResult(
+        context.analysis = AnalysisResult.model_construct(
             is_valid=analysis.is_valid,
             concerns=converted_concerns,
             score=analysis.score,
@@ -295,24 +443,28 @@ class GenerationStage(PipelineStage):
     
     name = "generation"
     description = "Generating configuration files"
+    depends_on = ("questionnaire", "analysis")
     
     def run(self, context: PipelineContext) -> PipelineContext:
         from ..generator.config_generator import ConfigGenerator
         
-        patterns = context.patterns.model_dump() if context.patterns else {}
-        research = context.research.model_dump() if context.research else {}
-        answers = context.answers.model_dump() if context.answers else {}
+        patterns = context.dump("patterns")
+        research = context.dump("research")
+        answers = context.dump("answers")
         
         generator = ConfigGenerator(patterns, research)
-        config = generator.generate(answers)
+        generator.generate(answers)
         
+        # Files come straight from our own generator, so skip re-validation;
+        # read its GeneratedFile objects rather than the dict copies in the
+        # returned config
         context.generated_files = [
-            GeneratedFile(
-                path=f["path"],
-                content=f.get("content", ""),
-                description=f.get("description", "")
+            GeneratedFile.model_construct(
+                path=f.path,
+                content=f.content,
+                description=f.description
             )
-            for f in config.get("files", [])
+            for f in generator.files
         ]
         
         console.print(f"\n[green]Generated {len(context.generated_files)} files[/]")
@@ -330,34 +482,28 @@ class ValidationStage(PipelineStage):
 
     name = "validation"
     description = "Validating configuration"
+    depends_on = ("generation",)
 
     def run(self, context: PipelineContext) -> PipelineContext:
         from ..validator.config_validator import ConfigValidator
-        from ..models import ValidationIssue as ModelValidationIssue, Severity
 
         validator = ConfigValidator()
 
-        # Build config dict for validation
+        # Build config dict for validation; the validator reads each file's
+        # path and content from the same shared dumps
+        files = context.dump("generated_files")
         config = {
-            "answers": context.answers.model_dump() if context.answers else {},
-            "files": [f.model_dump() for f in context.generated_files]
+            "answers": context.dump("answers"),
+            "files": files
         }
 
-        files_list = [
-            {"path": f.path, "content": f.content}
-            for f in context.generated_files
-        ]
-
-        report = validator.validate_generated_config(config, files_list)
-
-        # Convert dataclass issues to Pydantic models
-        def convert_severity(s: str) -> Severity:
-            mapping = {"error": Severity.CRITICAL, "warning": Severity.WARNING, "info": Severity.INFO}
-            return mapping.get(s.lower(), Severity.MEDIUM)
+        report = validator.validate_generated_config(config, files)
 
+        # Convert dataclass issues to Pydantic models (trusted validator
+        # output, so skip re-validation)
         converted_issues = [
-            ModelValidationIssue(
-                severity=convert_severity(i.severity),
+            ModelValidationIssue.model_construct(
+                severity=_VALIDATION_SEVERITY.get(i.severity.lower(), Severity.MEDIUM),
                 file=i.file,
                 line=i.line,
                 message=i.message,
@@ -366,7 +512,7 @@ class ValidationStage(PipelineStage):
             for i in report.issues
         ]
 
-        context.validation = ValidationReport(
+        context.validation = ValidationReport.model_construct(
             is_valid=report.is_valid,
             issues=converted_issues,
             score=report.score,
@@ -375,11 +521,12 @@ class ValidationStage(PipelineStage):
             checks_total=report.checks_total
         )
 
-        console.print(f"\n[cyan]Validation Score: {report.score}%[/]")
-        console.print(f"  {report.summary}")
-        
-        if not report.is_valid:
-            validator.print_report(report)
+        with _output_lock:
+            console.print(f"\n[cyan]Validation Score: {report.score}%[/]")
+            console.print(f"  {report.summary}")
+            
+            if not report.is_valid:
+                validator.print_report(report)
         
         return context
     
@@ -392,9 +539,17 @@ class ReviewStage(PipelineStage):
     
     name = "review"
     description = "Multi-model review"
+    depends_on = ("generation",)
+
+    # Reviews are slow, paid LLM calls, so results are reused for as long as
+    # the reviewed files and answers are unchanged; the models behind them
+    # change over time, so cached reviews expire after a week
+    CACHE_DIR = Path.home() / ".cache" / "config-setup-pipeline" / "review"
+    CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
     
-    def __init__(self, skip: bool = False):
+    def __init__(self, skip: bool = False, use_cache: bool = True):
         self._skip = skip
+        self.use_cache = use_cache
     
     def should_skip(self, context: PipelineContext) -> bool:
         if self._skip:
@@ -407,58 +562,89 @@ class ReviewStage(PipelineStage):
     
     def run(self, context: PipelineContext) -> PipelineContext:
         from ..review.reviewer import ConfigReviewer
-        from ..models import ReviewIssue as ModelReviewIssue, Severity, Category
 
         reviewer = ConfigReviewer()
 
         config = {
             "config_name": context.answers.config_name if context.answers else "unnamed",
-            "files": [f.model_dump() for f in context.generated_files],
-            "answers": context.answers.model_dump() if context.answers else {}
+            "files": context.dump("generated_files"),
+            "answers": context.dump("answers")
         }
 
-        results = reviewer.review(config)
-
-        # Convert dict issues to Pydantic models
-        def convert_severity(s: str) -> Severity:
-            mapping = {"critical": Severity.CRITICAL, "high": Severity.HIGH,
-                       "medium": Severity.MEDIUM, "low": Severity.LOW}
-            return mapping.get(s.lower(), Severity.MEDIUM)
-
-        def convert_category(c: str) -> Category:
-            mapping = {"security": Category.SECURITY, "best_practice": Category.BEST_PRACTICE,
-                       "missing": Category.MISSING, "improvement": Category.IMPROVEMENT}
-            return mapping.get(c.lower(), Category.IMPROVEMENT)
-
-        context.review_issues = [
-            ModelReviewIssue(
-                severity=convert_severity(i.get("severity", "medium")),
-                category=convert_category(i.get("category", "improvement")),
-                message=i.get("message", ""),
-                suggestion=i.get("suggestion", ""),
-                source=i.get("source", "unknown"),
-                file=i.get("file", ""),
-                confidence=i.get("confidence", 80)
-            )
-            for i in results.get("issues", [])
-        ]
-
-        summary = results.get("summary", {})
-        console.print(f"\n[cyan]Review complete![/]")
-        console.print(f"  • {summary.get('total', 0)} issues found")
-        console.print(f"  • {summary.get('critical', 0)} critical")
+        cache_file = self._cache_file(reviewer, config) if self.use_cache else None
+        review_issues = self._load_cached(cache_file)
+        cached = review_issues is not None
+        if not cached:
+            with _output_lock:
+                results = reviewer.review(config)
+
+            # Convert dict issues to Pydantic models; these come from external
+            # models, so validate them, but as one batch rather than per issue
+            issues = [
+                {
+                    "severity": _REVIEW_SEVERITY.get(i.get("severity", "medium").lower(), Severity.MEDIUM),
+                    "category": _REVIEW_CATEGORY.get(i.get("category", "improvement").lower(), Category.IMPROVEMENT),
+                    "message": i.get("message", ""),
+                    "suggestion": i.get("suggestion", ""),
+                    "source": i.get("source", "unknown"),
+                    "file": i.get("file", ""),
+                    "confidence": i.get("confidence", 80)
+                }
+                for i in results.get("issues", [])
+            ]
+            review_issues = _review_issues_adapter().validate_python(issues)
+            self._save_cached(cache_file, review_issues)
+
+        context.review_issues = review_issues
+
+        summary = {
+            "total": len(review_issues),
+            "critical": sum(1 for i in review_issues if i.severity == Severity.CRITICAL),
+        }
+        with _output_lock:
+            if cached:
+                console.print("\n[dim]Using cached review results[/]")
+            console.print(f"\n[cyan]Review complete![/]")
+            console.print(f"  • {summary.get('total', 0)} issues found")
+            console.print(f"  • {summary.get('critical', 0)} critical")
 
         return context
 
     def validate_input(self, context: PipelineContext) -> bool:
         return len(context.generated_files) > 0
 
+    def _cache_file(self, reviewer, config: dict) -> Path:
+        """Cache file for this exact config and set of reviewing models."""
+        import json
+        models = [name for name, key in (("openai", reviewer.openai_key), ("gemini", reviewer.gemini_key)) if key]
+        key = json.dumps([models, config], sort_keys=True, default=str)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return self.CACHE_DIR / f"{digest}.json"
+
+    def _load_cached(self, cache_file: Optional[Path]) -> Optional[list[ModelReviewIssue]]:
+        """Load fresh cached issues; missing, expired or corrupt entries return None."""
+        if cache_file is None:
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.CACHE_TTL_SECONDS:
+                return None
+            return _review_issues_adapter().validate_json(cache_file.read_bytes())
+        except Exception:
+            return None
+
+    def _save_cached(self, cache_file: Optional[Path], issues: list[ModelReviewIssue]) -> None:
+        """Atomically persist issues for later runs."""
+        # Failed model calls also come back as no issues; don't cache those
+        if cache_file is not None and issues:
+            atomic_write(cache_file, _review_issues_adapter().dump_json(issues))
+
 
 class WriteStage(PipelineStage):
     """Write configuration to disk."""
 
     name = "write"
     description = "Writing configuration files"
+    depends_on = ("validation", "review")
 
     def __init__(self, output_path: Optional[Path] = None, force: bool = False):
         self.output_path = output_path
@@ -466,17 +652,15 @@ class WriteStage(PipelineStage):
 
     def _sanitize_config_name(self, name: str) -> str:
         """Sanitize config name to prevent path traversal attacks."""
-        import re
         # Remove any path separators and parent directory references
         sanitized = name.replace("/", "").replace("\\", "").replace("..", "")
         # Only allow alphanumeric, hyphens, underscores
-        sanitized = re.sub(r'[^a-zA-Z0-9_-]', '', sanitized)
+        sanitized = _UNSAFE_NAME_CHARS.sub('', sanitized)
         # Ensure non-empty result
         return sanitized if sanitized else "new-config"
 
     def run(self, context: PipelineContext) -> PipelineContext:
-        import os
-        from ..generator.config_generator import ConfigGenerator
+        from ..generator.config_generator import write_files
 
         # Determine output path with sanitization
         base_dir = Path.cwd()
@@ -490,10 +674,7 @@ class WriteStage(PipelineStage):
         # SECURITY: Verify final path is within the base directory
         resolved_path = path.resolve()
         resolved_base = base_dir.resolve()
-        try:
-            # Use relative_to() which raises ValueError if path is not inside base
-            resolved_path.relative_to(resolved_base)
-        except ValueError:
+        if os.path.commonpath([resolved_path, resolved_base]) != str(resolved_base):
             raise ValueError(f"Invalid output path: {path} escapes base directory")
 
         path = resolved_path
@@ -503,18 +684,8 @@ class WriteStage(PipelineStage):
             if not Confirm.ask(f"\nWrite configuration to [cyan]{path}[/]?", default=True):
                 raise ValueError("User cancelled write operation")
         
-        # Write files
-        patterns = context.patterns.model_dump() if context.patterns else {}
-        research = context.research.model_dump() if context.research else {}
-        
-        generator = ConfigGenerator(patterns, research)
-        
-        config = {
-            "files": [f.model_dump() for f in context.generated_files],
-            "answers": context.answers.model_dump() if context.answers else {}
-        }
-        
-        generator.write_config(config, path)
+        # Write files straight from the context; no generator is needed
+        write_files(context.generated_files, path)
         
         console.print(f"\n[green]Configuration written to: {path}[/]")
         
@@ -522,3 +693,44 @@ class WriteStage(PipelineStage):
     
     def validate_input(self, context: PipelineContext) -> bool:
         return len(context.generated_files) > 0
+
+
+def build_default_pipeline(
+    quick: bool = False,
+    skip_research: bool = False,
+    skip_review: bool = False,
+    answers_file: Optional[Path] = None,
+    output_path: Optional[Path] = None,
+    dry_run: bool = False,
+    checkpoint_file: Optional[Path] = None,
+    use_cache: bool = True,
+) -> Pipeline:
+    """Build the standard generate pipeline (WriteStage is omitted for dry runs)."""
+    stages = [
+        SetupStage(quick_mode=quick),
+        ConfigDiscoveryStage(),
+        ResearchStage(deep=not quick, skip=skip_research, use_cache=use_cache),
+        QuestionnaireStage(answers_file=answers_file),
+        CriticalAnalysisStage(),
+        GenerationStage(),
+        ValidationStage(),
+        ReviewStage(skip=skip_review, use_cache=use_cache),
+    ]
+    if not dry_run:
+        stages.append(WriteStage(output_path=output_path))
+    checkpoint_key = _checkpoint_key(
+        answers_file, quick=quick, skip_research=skip_research, skip_review=skip_review
+    )
+    return Pipeline(stages, checkpoint_file=checkpoint_file, checkpoint_key=checkpoint_key)
+
+
+def _checkpoint_key(answers_file: Optional[Path], **options) -> str:
+    """Fingerprint the inputs a run's checkpoint is only valid for."""
+    parts = [f"{name}={value}" for name, value in sorted(options.items())]
+    if answers_file is not None:
+        try:
+            st = answers_file.stat()
+            parts.append(f"answers={answers_file.resolve()}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"answers={answers_file}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
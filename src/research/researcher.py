@@ -78,6 +78,9 @@ class BestPracticesResearcher:
         },
     ]
 
+    # GitHub repository search for community configs
+    COMMUNITY_QUERY = "claude code configuration"
+
     # Research topics with context
     RESEARCH_TOPICS = {
         "security": {
@@ -132,11 +135,16 @@ class BestPracticesResearcher:
 
     def research_all(self, deep: bool = True) -> dict:
         """Run comprehensive research on all topics."""
-        print("   Gathering sources from official documentation...")
-        self._fetch_official_sources()
+        # The GitHub search doesn't depend on the official sources, so start
+        # it now and let it overlap with their fetches
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            github_results = executor.submit(self._search_github, self.COMMUNITY_QUERY)
+
+            print("   Gathering sources from official documentation...")
+            self._fetch_official_sources()
 
-        print("   Searching community resources...")
-        self._search_community_resources()
+            print("   Searching community resources...")
+            self._search_community_resources(github_results.result())
 
         if deep and (self.openai_key or self.gemini_key):
             print("   Running deep analysis with LLM synthesis...")
@@ -180,25 +188,28 @@ class BestPracticesResearcher:
 
     def _fetch_official_sources(self) -> None:
         """Fetch content from official sources."""
-        for source_info in self.OFFICIAL_SOURCES:
-            try:
-                content = self._fetch_url_content(source_info["url"])
-                if content:
-                    self.sources.append(ResearchSource(
-                        name=source_info["name"],
-                        url=source_info["url"],
-                        type=source_info["type"],
-                        content=content[:5000],
-                        relevance=0.95,
-                        timestamp=datetime.now().isoformat()
-                    ))
-            except Exception:
-                pass
+        # Each fetch is an independent network round-trip, so issue them
+        # concurrently; map() keeps the results in source order
+        urls = [source_info["url"] for source_info in self.OFFICIAL_SOURCES]
+        with ThreadPoolExecutor(max_workers=len(urls) or 1) as executor:
+            contents = list(executor.map(self._fetch_url_content, urls))
 
-    def _search_community_resources(self) -> None:
+        for source_info, content in zip(self.OFFICIAL_SOURCES, contents):
+            if content:
+                self.sources.append(ResearchSource(
+                    name=source_info["name"],
+                    url=source_info["url"],
+                    type=source_info["type"],
+                    content=content[:5000],
+                    relevance=0.95,
+                    timestamp=datetime.now().isoformat()
+                ))
+
+    def _search_community_resources(self, github_results: Optional[list[ResearchSource]] = None) -> None:
         """Search community resources like GitHub and forums."""
-        # Search GitHub for claude configs
-        github_results = self._search_github("claude code configuration")
+        # Search GitHub for claude configs, unless the caller already has
+        if github_results is None:
+            github_results = self._search_github(self.COMMUNITY_QUERY)
         for result in github_results[:5]:
             self.sources.append(result)
 
@@ -66,13 +66,18 @@ class APIKeyManager:
         self.config_dir = config_dir or Path.home() / ".config" / "config-setup-pipeline"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.env_file = self.config_dir / ".env"
+        # mtime of the .env file as of the last load_env_file() call
+        self._loaded_env_mtime: Optional[int] = None
 
     def get_key(self, key_name: str) -> Optional[str]:
         """Get an API key from any available source."""
         key_config = self._get_key_config(key_name)
         if not key_config:
             return None
+        return self._resolve_key(key_config)
 
+    def _resolve_key(self, key_config: APIKeyConfig, env_values: Optional[dict] = None) -> Optional[str]:
+        """Look up a key's value; env_values is a pre-read .env mapping, if any."""
         # Priority: env var > .env file > keyring
         # 1. Check environment variable
         value = os.environ.get(key_config.env_var)
@@ -80,7 +85,10 @@ class APIKeyManager:
             return value
 
         # 2. Check .env file
-        value = self._load_from_env_file(key_config.env_var)
+        if env_values is None:
+            value = self._load_from_env_file(key_config.env_var)
+        else:
+            value = env_values.get(key_config.env_var)
         if value:
             return value
 
@@ -126,8 +134,10 @@ class APIKeyManager:
     def get_status(self) -> dict:
         """Get status of all API keys."""
         status = {}
+        # Read the .env file once for all keys rather than once per key
+        env_values = self._read_env_file()
         for key_config in self.SUPPORTED_KEYS:
-            value = self.get_key(key_config.name)
+            value = self._resolve_key(key_config, env_values)
             status[key_config.name] = {
                 "display_name": key_config.display_name,
                 "env_var": key_config.env_var,
@@ -216,23 +226,30 @@ class APIKeyManager:
 
     def _load_from_env_file(self, var_name: str) -> Optional[str]:
         """Load a value from the .env file."""
+        return self._read_env_file().get(var_name)
+
+    def _read_env_file(self) -> dict:
+        """Parse every VAR=value line of the .env file (first occurrence wins)."""
+        values = {}
         if not self.env_file.exists():
-            return None
+            return values
 
         try:
             content = self.env_file.read_text()
             for line in content.split("\n"):
-                if line.startswith(f"{var_name}="):
-                    value = line[len(var_name) + 1:].strip()
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    return value
+                var, sep, value = line.partition("=")
+                if not sep or var in values:
+                    continue
+                value = value.strip()
+                # Remove quotes if present
+                if value.startswith('"') and value.endswith('"'):
+                    value = value[1:-1]
+                elif value.startswith("'") and value.endswith("'"):
+                    value = value[1:-1]
+                values[var] = value
         except Exception:
             pass
-        return None
+        return values
 
     def _save_to_env_file(self, var_name: str, value: str) -> bool:
         """Save a value to the .env file."""
@@ -323,7 +340,12 @@ class APIKeyManager:
 
     def load_env_file(self) -> None:
         """Load all keys from .env file into environment."""
-        if not self.env_file.exists():
+        try:
+            mtime = self.env_file.stat().st_mtime_ns
+        except OSError:
+            return
+        # Already loaded and unchanged since
+        if mtime == self._loaded_env_mtime:
             return
 
         try:
@@ -339,5 +361,6 @@ class APIKeyManager:
                         value = value[1:-1]
                     if var and value:
                         os.environ[var] = value
+            self._loaded_env_mtime = mtime
         except Exception:
             pass
@@ -0,0 +1,15 @@
+"""Tests for config analyzer frontmatter parsing."""
+
+from src.analyzer.config_analyzer import ConfigAnalyzer
+
+
+def test_empty_field_does_not_swallow_next_line():
+    fields = ConfigAnalyzer._parse_frontmatter_fields("description:\ntools: Read, Grep")
+    assert fields == {"tools": "Read, Grep"}
+
+
+def test_keys_match_exactly_and_first_value_wins():
+    fields = ConfigAnalyzer._parse_frontmatter_fields(
+        "name: first\nallowed-tools: Read\nname: second\n"
+    )
+    assert fields == {"name": "first", "allowed-tools": "Read"}
@@ -0,0 +1,36 @@
+"""Tests for the critical advisor's per-instance analysis cache."""
+
+from src.advisor.critical_advisor import CriticalAdvisor
+
+ANSWERS = {
+    "purpose": "Enterprise/production",
+    "autonomy_level": "Assistant - Only does what's asked",
+    "security_level": "Standard - Balanced safety",
+    "enable_multi_model": True,
+}
+
+
+def test_repeat_analysis_returns_an_equal_independent_copy():
+    advisor = CriticalAdvisor()
+    first = advisor.analyze_choices(ANSWERS)
+    second = advisor.analyze_choices(ANSWERS)
+
+    assert second == first
+    assert second is not first
+    assert second.concerns is not first.concerns
+    assert advisor.concerns is second.concerns
+    assert advisor._score == first.score
+
+
+def test_mutating_a_result_does_not_corrupt_the_cache():
+    advisor = CriticalAdvisor()
+    first = advisor.analyze_choices(ANSWERS)
+    expected = list(first.concerns)
+
+    first.concerns.clear()
+    first.score = 0
+    advisor.concerns.append(expected[0])
+
+    again = advisor.analyze_choices(ANSWERS)
+    assert again.concerns == expected
+    assert again.score != 0
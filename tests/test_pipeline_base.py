@@ -0,0 +1,146 @@
+"""Tests for pipeline stage scheduling."""
+
+from src.models import PipelineContext
+from src.pipeline.base import Pipeline, PipelineStage
+
+
+class RecordingStage(PipelineStage):
+    """Stage that records its name in the shared run order."""
+
+    def __init__(self, name, depends_on=None, order=None):
+        self.name = name
+        self.depends_on = depends_on
+        self.order = order if order is not None else []
+
+    def run(self, context: PipelineContext) -> PipelineContext:
+        self.order.append(self.name)
+        return context
+
+
+def _stage_names(pipeline):
+    return [[pipeline.stages[i].name for i in wave] for wave in pipeline._waves]
+
+
+def test_declared_dependencies_share_waves():
+    pipeline = Pipeline([
+        RecordingStage("setup", ()),
+        RecordingStage("discovery", ("setup",)),
+        RecordingStage("research", ("setup",)),
+        RecordingStage("questionnaire", ("discovery", "research")),
+    ])
+    assert _stage_names(pipeline) == [["setup"], ["discovery", "research"], ["questionnaire"]]
+
+
+def test_plain_list_runs_sequentially():
+    pipeline = Pipeline([RecordingStage("a"), RecordingStage("b"), RecordingStage("c")])
+    assert _stage_names(pipeline) == [["a"], ["b"], ["c"]]
+
+
+def test_plugin_in_the_middle_is_a_barrier():
+    order = []
+    pipeline = Pipeline([
+        RecordingStage("setup", (), order),
+        RecordingStage("discovery", ("setup",), order),
+        RecordingStage("research", ("setup",), order),
+        RecordingStage("plugin", None, order),
+        RecordingStage("questionnaire", ("discovery", "research"), order),
+    ])
+    assert _stage_names(pipeline) == [
+        ["setup"], ["discovery", "research"], ["plugin"], ["questionnaire"]
+    ]
+
+    context = pipeline.run(PipelineContext())
+    assert order.index("plugin") > max(order.index("discovery"), order.index("research"))
+    assert order.index("questionnaire") > order.index("plugin")
+    assert context.completed_stages[-2:] == ["plugin", "questionnaire"]
+
+
+class FailOnceStage(RecordingStage):
+    """Stage that raises on its first run and succeeds afterwards."""
+
+    def __init__(self, name, depends_on=None, order=None):
+        super().__init__(name, depends_on, order)
+        self.failed = False
+
+    def run(self, context: PipelineContext) -> PipelineContext:
+        if not self.failed:
+            self.failed = True
+            raise RuntimeError(f"{self.name} failed")
+        return super().run(context)
+
+
+def _chain(order, last_cls=RecordingStage):
+    return [
+        RecordingStage("a", (), order),
+        RecordingStage("b", ("a",), order),
+        last_cls("c", ("b",), order),
+    ]
+
+
+def _interrupted_run(checkpoint_file, key=""):
+    """Run a, b and a failing c, leaving a checkpoint after b."""
+    order = []
+    stages = _chain(order, FailOnceStage)
+    try:
+        Pipeline(stages, checkpoint_file=checkpoint_file, checkpoint_key=key).run()
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("stage c should have failed")
+    assert order == ["a", "b"]
+    assert checkpoint_file.exists()
+    return stages
+
+
+def test_resume_runs_only_unfinished_stages(tmp_path):
+    checkpoint_file = tmp_path / "checkpoint.json"
+    stages = _interrupted_run(checkpoint_file, key="inputs")
+
+    order = []
+    for stage in stages:
+        stage.order = order
+    context = Pipeline(stages, checkpoint_file=checkpoint_file, checkpoint_key="inputs").run(
+        resume=True
+    )
+
+    assert order == ["c"]
+    assert context.completed_stages == ["a", "b", "c"]
+    assert not checkpoint_file.exists()
+
+
+def test_resume_ignores_checkpoint_with_other_key(tmp_path):
+    checkpoint_file = tmp_path / "checkpoint.json"
+    _interrupted_run(checkpoint_file, key="old-inputs")
+
+    order = []
+    Pipeline(_chain(order), checkpoint_file=checkpoint_file, checkpoint_key="new-inputs").run(
+        resume=True
+    )
+
+    assert order == ["a", "b", "c"]
+
+
+def test_resume_ignores_corrupt_checkpoint(tmp_path):
+    checkpoint_file = tmp_path / "checkpoint.json"
+    checkpoint_file.write_text("{not json", encoding="utf-8")
+
+    order = []
+    context = Pipeline(_chain(order), checkpoint_file=checkpoint_file).run(resume=True)
+
+    assert order == ["a", "b", "c"]
+    assert context.completed_stages == ["a", "b", "c"]
+
+
+def test_checkpoint_removed_after_complete_run(tmp_path):
+    checkpoint_file = tmp_path / "checkpoint.json"
+    Pipeline(_chain([]), checkpoint_file=checkpoint_file).run()
+    assert not checkpoint_file.exists()
+
+
+def test_checkpoint_kept_after_stop_after(tmp_path):
+    checkpoint_file = tmp_path / "checkpoint.json"
+    order = []
+    Pipeline(_chain(order), checkpoint_file=checkpoint_file).run(stop_after="b")
+
+    assert order == ["a", "b"]
+    assert checkpoint_file.exists()
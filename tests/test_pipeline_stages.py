@@ -0,0 +1,87 @@
+"""Tests for the answers file loader used by QuestionnaireStage."""
+
+import datetime
+import json
+import os
+
+import pytest
+
+from src.pipeline import stages
+
+
+@pytest.fixture(autouse=True)
+def answers_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(stages, "_ANSWERS_CACHE_DIR", cache_dir)
+    stages._load_answers.cache_clear()
+    yield cache_dir
+    stages._load_answers.cache_clear()
+
+
+def _load(path):
+    st = path.stat()
+    return stages._load_answers(path, st.st_mtime_ns, st.st_size)
+
+
+def _cache_files(cache_dir):
+    return list(cache_dir.glob("*.json")) if cache_dir.exists() else []
+
+
+def test_yaml_answers_are_cached_as_json(tmp_path, answers_cache_dir):
+    answers_file = tmp_path / "answers.yaml"
+    answers_file.write_text("config_name: demo\nenable_memory: true\n", encoding="utf-8")
+
+    assert _load(answers_file) == {"config_name": "demo", "enable_memory": True}
+    [cache_file] = _cache_files(answers_cache_dir)
+
+    # A new process reads the JSON copy instead of parsing the YAML again
+    entry = json.loads(cache_file.read_text(encoding="utf-8"))
+    entry["answers"]["config_name"] = "from-cache"
+    cache_file.write_text(json.dumps(entry), encoding="utf-8")
+    stages._load_answers.cache_clear()
+    assert _load(answers_file)["config_name"] == "from-cache"
+
+
+def test_edited_file_is_parsed_again(tmp_path, answers_cache_dir):
+    answers_file = tmp_path / "answers.yaml"
+    answers_file.write_text("config_name: first\n", encoding="utf-8")
+    assert _load(answers_file) == {"config_name": "first"}
+
+    answers_file.write_text("config_name: second-name\n", encoding="utf-8")
+    st = answers_file.stat()
+    os.utime(answers_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert _load(answers_file) == {"config_name": "second-name"}
+    [cache_file] = _cache_files(answers_cache_dir)
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["answers"] == {
+        "config_name": "second-name"
+    }
+
+
+def test_yaml_with_date_is_not_cached(tmp_path, answers_cache_dir):
+    answers_file = tmp_path / "answers.yaml"
+    answers_file.write_text("config_name: dated\ncreated: 2024-01-02\n", encoding="utf-8")
+
+    assert _load(answers_file) == {"config_name": "dated", "created": datetime.date(2024, 1, 2)}
+    assert _cache_files(answers_cache_dir) == []
+
+
+def test_yaml_with_non_string_keys_is_not_cached(tmp_path, answers_cache_dir):
+    answers_file = tmp_path / "answers.yaml"
+    answers_file.write_text("ports:\n  8080: web\n", encoding="utf-8")
+
+    assert _load(answers_file) == {"ports": {8080: "web"}}
+    assert _cache_files(answers_cache_dir) == []
+
+
+def test_corrupt_cache_falls_back_to_yaml(tmp_path, answers_cache_dir):
+    answers_file = tmp_path / "answers.yaml"
+    answers_file.write_text("config_name: demo\n", encoding="utf-8")
+    _load(answers_file)
+    [cache_file] = _cache_files(answers_cache_dir)
+
+    cache_file.write_text("{not json", encoding="utf-8")
+    stages._load_answers.cache_clear()
+
+    assert _load(answers_file) == {"config_name": "demo"}
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["answers"] == {"config_name": "demo"}